@@ -3,7 +3,7 @@ Base splitter abstract class for contract document splitting.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Iterator, Tuple
 import os
 import logging
 from pathlib import Path
@@ -11,6 +11,30 @@ from pathlib import Path
 logger = logging.getLogger(__name__)
 
 
+def _walk_sections(sections: List[Dict[str, Any]]) -> Iterator[Tuple[Dict[str, Any], str]]:
+    """
+    Iterate hierarchical sections in document (pre-)order without recursion.
+
+    Args:
+        sections: List of hierarchical section dictionaries
+
+    Yields:
+        (section, full_heading) pairs, where full_heading joins the headings
+        from the root down to the section with " > "
+    """
+    # Children are pushed in reverse so they are popped in document order
+    stack = [(section, "") for section in reversed(sections)]
+    while stack:
+        section, parent_heading = stack.pop()
+        heading = section.get("heading", "")
+        full_heading = f"{parent_heading} > {heading}" if parent_heading else heading
+        yield section, full_heading
+
+        subsections = section.get("subsections", [])
+        if subsections:
+            stack.extend((sub, full_heading) for sub in reversed(subsections))
+
+
 class BaseSplitter(ABC):
     """
     Abstract base class for document splitters.
@@ -492,6 +516,28 @@ class ContractSplitter:
             )
         return self._pdf_splitter
     
+    def reconfigure(self, max_tokens: Optional[int] = None, overlap: Optional[int] = None) -> None:
+        """
+        Update chunk sizing parameters in place.
+        
+        Already-initialized format splitters (and the structure detectors they
+        loaded) are kept and receive the new values, so one instance can be
+        reused across several max_tokens/overlap settings.
+        
+        Args:
+            max_tokens: New maximum tokens per chunk (unchanged if None)
+            overlap: New overlap length (unchanged if None)
+        """
+        if max_tokens is not None:
+            self.max_tokens = max_tokens
+        if overlap is not None:
+            self.overlap = overlap
+        
+        for splitter in (self._docx_splitter, self._pdf_splitter):
+            if splitter is not None:
+                splitter.max_tokens = self.max_tokens
+                splitter.overlap = self.overlap
+    
     def split(self, file_path: str) -> List[Dict[str, Any]]:
         """
         Split document into hierarchical sections based on file type.
@@ -527,77 +573,28 @@ class ContractSplitter:
         if strategy is None:
             strategy = self.chunking_strategy
 
-        chunks = []
-
-        def extract_chunks_finest_granularity(section_list: List[Dict[str, Any]], parent_heading: str = ""):
-            """同等最细粒度拆分策略：只处理叶子节点，避免重复"""
-            for section in section_list:
-                heading = section.get("heading", "")
-                content = section.get("content", "")
-                subsections = section.get("subsections", [])
-
-                # Create full heading path
-                full_heading = f"{parent_heading} > {heading}" if parent_heading else heading
-
-                if subsections:
-                    # 有子sections，递归处理子sections，不处理当前content
-                    extract_chunks_finest_granularity(subsections, full_heading)
-                else:
-                    # 没有子sections，这是叶子节点，处理其content
-                    if content.strip():
-                        from .utils import clean_text
-                        chunk_text = f"{full_heading}\n\n{content}" if heading else content
-                        chunks.append(clean_text(chunk_text))
-
-        def extract_chunks_all_levels(section_list: List[Dict[str, Any]], parent_heading: str = ""):
-            """所有层级拆分策略：处理所有有内容的节点"""
-            for section in section_list:
-                heading = section.get("heading", "")
-                content = section.get("content", "")
-                subsections = section.get("subsections", [])
-
-                # Create full heading path
-                full_heading = f"{parent_heading} > {heading}" if parent_heading else heading
-
-                # 处理当前节点的内容（如果有）
-                if content.strip():
-                    from .utils import clean_text
-                    chunk_text = f"{full_heading}\n\n{content}" if heading else content
-                    chunks.append(clean_text(chunk_text))
-
-                # 递归处理子sections
-                if subsections:
-                    extract_chunks_all_levels(subsections, full_heading)
-
-        def extract_chunks_parent_only(section_list: List[Dict[str, Any]], parent_heading: str = ""):
-            """仅父级拆分策略：只处理有内容且无子节点的父级"""
-            for section in section_list:
-                heading = section.get("heading", "")
-                content = section.get("content", "")
-                subsections = section.get("subsections", [])
-
-                # Create full heading path
-                full_heading = f"{parent_heading} > {heading}" if parent_heading else heading
-
-                if not subsections and content.strip():
-                    # 只有没有子sections且有内容的才处理
-                    from .utils import clean_text
-                    chunk_text = f"{full_heading}\n\n{content}" if heading else content
-                    chunks.append(clean_text(chunk_text))
-                elif subsections:
-                    # 有子sections，递归处理
-                    extract_chunks_parent_only(subsections, full_heading)
-
         # 根据策略选择处理方法
-        if strategy == "finest_granularity":
-            extract_chunks_finest_granularity(sections)
+        if strategy in ("finest_granularity", "parent_only"):
+            # 同等最细粒度 / 仅父级：只处理没有子sections且有内容的节点
+            leaves_only = True
         elif strategy == "all_levels":
-            extract_chunks_all_levels(sections)
-        elif strategy == "parent_only":
-            extract_chunks_parent_only(sections)
+            # 所有层级：处理所有有内容的节点
+            leaves_only = False
         else:
             raise ValueError(f"Unknown strategy: {strategy}. Supported: 'finest_granularity', 'all_levels', 'parent_only'")
 
+        from .utils import clean_text
+
+        chunks = []
+        for section, full_heading in _walk_sections(sections):
+            content = section.get("content", "")
+            if not content.strip():
+                continue
+            if leaves_only and section.get("subsections", []):
+                continue
+            chunk_text = f"{full_heading}\n\n{content}" if section.get("heading", "") else content
+            chunks.append(clean_text(chunk_text))
+
         # Remove duplicates while preserving order
         chunks = self._remove_duplicate_chunks(chunks)
 
@@ -96,8 +96,7 @@ class Config:
             config_file: 配置文件路径
         """
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                file_config = json.load(f)
+            file_config = json.loads(Path(config_file).read_text(encoding='utf-8'))
             
             # 深度合并配置
             self._deep_merge(self.config, file_config)
@@ -207,8 +206,10 @@ class Config:
             # 确保目录存在
             os.makedirs(os.path.dirname(config_file), exist_ok=True)
             
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            # 序列化后一次写入，而不是json.dump逐段写文件
+            Path(config_file).write_text(
+                json.dumps(self.config, indent=2, ensure_ascii=False), encoding='utf-8'
+            )
             
             logger.info(f"Configuration saved to {config_file}")
             
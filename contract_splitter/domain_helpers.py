@@ -724,28 +724,50 @@ class DomainContractSplitter:
         
         return configs.get(contract_type, configs["general"])
     
-    def split_contract(self, file_path: str) -> List[str]:
+    def _create_splitter(self, file_path: str):
+        """检查文件格式并用工厂创建合适的splitter"""
+        # 检查文件格式支持
+        if not self.factory.is_supported_format(file_path):
+            file_format = self.factory.detect_file_format(file_path)
+            raise ValueError(f"Unsupported file format: .{file_format}. Supported formats: {self.factory.get_supported_formats()}")
+
+        # 使用工厂模式创建合适的splitter
+        return self.factory.create_splitter(file_path, **self.splitter_config)
+
+    def parse_document(self, file_path: str) -> List[Dict[str, Any]]:
+        """
+        只做层次化解析，不展开也不做后处理
+
+        解析结果只取决于splitter_config中除chunking_strategy以外的参数，
+        参数相同的多个合同类型可以共用同一份sections（传给split_contract）。
+
+        Args:
+            file_path: 文档路径 (支持 .docx, .doc, .pdf, .wps)
+
+        Returns:
+            层次化sections列表
+        """
+        return self._create_splitter(file_path).split(file_path)
+
+    def split_contract(self, file_path: str,
+                       sections: Optional[List[Dict[str, Any]]] = None) -> List[str]:
         """
         切分合同文档
 
         Args:
             file_path: 文档路径 (支持 .docx, .doc, .pdf, .wps)
+            sections: 已由parse_document解析好的sections，提供时不再重新解析文档
 
         Returns:
             切分后的chunks列表
         """
         logger.info(f"Processing {self.contract_type} contract: {file_path}")
 
-        # 检查文件格式支持
-        if not self.factory.is_supported_format(file_path):
-            file_format = self.factory.detect_file_format(file_path)
-            raise ValueError(f"Unsupported file format: .{file_format}. Supported formats: {self.factory.get_supported_formats()}")
-
-        # 使用工厂模式创建合适的splitter
-        splitter = self.factory.create_splitter(file_path, **self.splitter_config)
+        splitter = self._create_splitter(file_path)
 
-        # 使用层次化分割
-        sections = splitter.split(file_path)
+        # 使用层次化分割（已有解析结果时直接复用）
+        if sections is None:
+            sections = splitter.split(file_path)
 
         # 根据合同类型选择策略
         config = self._get_contract_config(self.contract_type)
@@ -893,28 +915,50 @@ class RegulationSplitter:
         
         return configs.get(regulation_type, configs["general"])
     
-    def split_regulation(self, file_path: str) -> List[str]:
+    def _create_splitter(self, file_path: str):
+        """检查文件格式并用工厂创建合适的splitter"""
+        # 检查文件格式支持
+        if not self.factory.is_supported_format(file_path):
+            file_format = self.factory.detect_file_format(file_path)
+            raise ValueError(f"Unsupported file format: .{file_format}. Supported formats: {self.factory.get_supported_formats()}")
+
+        # 使用工厂模式创建合适的splitter
+        return self.factory.create_splitter(file_path, **self.splitter_config)
+
+    def parse_document(self, file_path: str) -> List[Dict[str, Any]]:
+        """
+        只做层次化解析，不展开也不做后处理
+
+        解析结果只取决于splitter_config中除chunking_strategy以外的参数，
+        参数相同的多个规章制度类型可以共用同一份sections（传给split_regulation）。
+
+        Args:
+            file_path: 文档路径 (支持 .docx, .doc, .pdf, .wps)
+
+        Returns:
+            层次化sections列表
+        """
+        return self._create_splitter(file_path).split(file_path)
+
+    def split_regulation(self, file_path: str,
+                         sections: Optional[List[Dict[str, Any]]] = None) -> List[str]:
         """
         切分规章制度文档
 
         Args:
             file_path: 文档路径 (支持 .docx, .doc, .pdf, .wps)
+            sections: 已由parse_document解析好的sections，提供时不再重新解析文档
 
         Returns:
             切分后的chunks列表
         """
         logger.info(f"Processing {self.regulation_type} regulation: {file_path}")
 
-        # 检查文件格式支持
-        if not self.factory.is_supported_format(file_path):
-            file_format = self.factory.detect_file_format(file_path)
-            raise ValueError(f"Unsupported file format: .{file_format}. Supported formats: {self.factory.get_supported_formats()}")
-
-        # 使用工厂模式创建合适的splitter
-        splitter = self.factory.create_splitter(file_path, **self.splitter_config)
+        splitter = self._create_splitter(file_path)
 
-        # 使用层次化分割
-        sections = splitter.split(file_path)
+        # 使用层次化分割（已有解析结果时直接复用）
+        if sections is None:
+            sections = splitter.split(file_path)
 
         # 根据规章类型选择策略
         config = self._get_regulation_config(self.regulation_type)
@@ -968,33 +1012,37 @@ def split_legal_document(file_path: str, **kwargs) -> List[str]:
     return splitter.split_legal_document(file_path)
 
 
-def split_contract(file_path: str, contract_type: str = "general", **kwargs) -> List[str]:
+def split_contract(file_path: str, contract_type: str = "general",
+                   sections: Optional[List[Dict[str, Any]]] = None, **kwargs) -> List[str]:
     """
     便捷函数：切分合同文档
     
     Args:
         file_path: 文档路径
         contract_type: 合同类型
+        sections: 已解析好的sections，提供时不再重新解析文档
         **kwargs: 其他参数
         
     Returns:
         切分后的chunks列表
     """
     splitter = DomainContractSplitter(contract_type=contract_type, **kwargs)
-    return splitter.split_contract(file_path)
+    return splitter.split_contract(file_path, sections=sections)
 
 
-def split_regulation(file_path: str, regulation_type: str = "general", **kwargs) -> List[str]:
+def split_regulation(file_path: str, regulation_type: str = "general",
+                     sections: Optional[List[Dict[str, Any]]] = None, **kwargs) -> List[str]:
     """
     便捷函数：切分规章制度文档
     
     Args:
         file_path: 文档路径
         regulation_type: 规章类型
+        sections: 已解析好的sections，提供时不再重新解析文档
         **kwargs: 其他参数
         
     Returns:
         切分后的chunks列表
     """
     splitter = RegulationSplitter(regulation_type=regulation_type, **kwargs)
-    return splitter.split_regulation(file_path)
+    return splitter.split_regulation(file_path, sections=sections)
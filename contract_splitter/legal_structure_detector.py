@@ -165,11 +165,14 @@ class LegalStructureDetector:
                 # 对于条文，需要额外检查是否真的是标题而不是内容
                 if level == LegalStructureLevel.ARTICLE:
                     # 如果文本太长或包含明显的内容词，则不认为是标题
-                    if (len(text) > 50 or
-                        any(word in text for word in ['内容', '规定', '说明', '包含', '详细', '很长', '多'])):
+                    if self._is_article_content(text):
                         continue
                 return True
         
+        return self._matches_general_heading(text)
+    
+    def _matches_general_heading(self, text: str) -> bool:
+        """未匹配法律结构时，按通用编号和模糊规则判断是否为标题"""
         # 如果是法律文档，优先使用法律模式
         if self.document_type == "legal":
             return False
@@ -212,13 +215,54 @@ class LegalStructureDetector:
                 # 对于条文，需要额外检查是否真的是标题而不是内容
                 if level == LegalStructureLevel.ARTICLE:
                     # 如果文本太长或包含明显的内容词，则返回默认层级
-                    if (len(text) > 50 or
-                        any(word in text for word in ['内容', '规定', '说明', '包含', '详细', '很长', '多'])):
+                    if self._is_article_content(text):
                         return 10
                 return level.value
 
         # 默认层级
         return 10
+
+    def classify(self, text: str) -> Tuple[bool, int]:
+        """
+        一次遍历同时判断是否为标题并获取标题层级
+
+        Args:
+            text: 待检测文本
+
+        Returns:
+            (是否为标题, 层级)，标题的层级与get_heading_level一致，非标题返回默认层级10
+        """
+        if not text:
+            return False, 10
+
+        text = text.strip()
+
+        # 过短或过长的文本不是标题
+        if len(text) < 2 or len(text) > 200:
+            return False, 10
+
+        level_value = 10
+        first_match = True
+
+        for level in LegalStructureLevel:
+            if not self._matches_level(text, level):
+                continue
+
+            # 条文内容不算标题，且首个匹配为条文内容时层级取默认值
+            is_content = level == LegalStructureLevel.ARTICLE and self._is_article_content(text)
+            if first_match and not is_content:
+                level_value = level.value
+            first_match = False
+            if not is_content:
+                return True, level_value
+
+        return self._matches_general_heading(text), 10
+
+    @staticmethod
+    def _is_article_content(text: str) -> bool:
+        """匹配条文模式的文本是否实际为条文内容而非标题"""
+        return (len(text) > 50 or
+                any(word in text for word in ['内容', '规定', '说明', '包含', '详细', '很长', '多']))
     
     def _matches_level(self, text: str, level: LegalStructureLevel) -> bool:
         """检查文本是否匹配特定层级"""
@@ -450,8 +494,8 @@ class LegalStructureDetector:
             return patterns
 
 
-# 全局实例
-_default_detector = None
+# 全局实例缓存：每种文档类型（及自定义模式）只构建、编译一次检测器
+_detector_cache: Dict[Tuple[str, Optional[str]], LegalStructureDetector] = {}
 
 
 def get_legal_detector(document_type: str = "legal", 
@@ -466,9 +510,12 @@ def get_legal_detector(document_type: str = "legal",
     Returns:
         检测器实例
     """
-    global _default_detector
+    patterns_key = repr(sorted(custom_patterns.items())) if custom_patterns else None
+    cache_key = (document_type, patterns_key)
     
-    if _default_detector is None or _default_detector.document_type != document_type:
-        _default_detector = LegalStructureDetector(document_type, custom_patterns)
+    detector = _detector_cache.get(cache_key)
+    if detector is None:
+        detector = LegalStructureDetector(document_type, custom_patterns)
+        _detector_cache[cache_key] = detector
     
-    return _default_detector
+    return detector
@@ -2,13 +2,54 @@
 Utility functions for document processing, token counting, and text splitting.
 """
 
+import hashlib
 import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Union, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _get_tiktoken_encoding():
+    """Build the tiktoken encoding once per process."""
+    import tiktoken
+    return tiktoken.get_encoding("cl100k_base")  # GPT-4 encoding
+
+
+# Memoized tiktoken counts. Short texts are keyed by themselves; longer ones by a
+# blake2b digest so the cache never pins whole documents in memory.
+_TOKEN_COUNT_CACHE_SIZE = 4096
+_TOKEN_COUNT_KEY_MAX_CHARS = 512
+_token_count_cache: "OrderedDict[Union[str, bytes], int]" = OrderedDict()
+_token_count_lock = threading.Lock()
+
+
+def _count_tiktoken_tokens(text: str) -> int:
+    """Count tiktoken tokens, memoized for texts re-counted across overlaps."""
+    if len(text) <= _TOKEN_COUNT_KEY_MAX_CHARS:
+        key: Union[str, bytes] = text
+    else:
+        key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+    with _token_count_lock:
+        count = _token_count_cache.get(key)
+        if count is not None:
+            _token_count_cache.move_to_end(key)
+            return count
+
+    count = len(_get_tiktoken_encoding().encode(text))
+
+    with _token_count_lock:
+        _token_count_cache[key] = count
+        if len(_token_count_cache) > _TOKEN_COUNT_CACHE_SIZE:
+            _token_count_cache.popitem(last=False)
+    return count
+
+
 def count_tokens(text: str, method: str = "character") -> int:
     """
     Count tokens in text using specified method.
@@ -24,9 +65,7 @@ def count_tokens(text: str, method: str = "character") -> int:
         return len(text)
     elif method == "tiktoken":
         try:
-            import tiktoken
-            encoding = tiktoken.get_encoding("cl100k_base")  # GPT-4 encoding
-            return len(encoding.encode(text))
+            return _count_tiktoken_tokens(text)
         except ImportError:
             logger.warning("tiktoken not available, falling back to character count")
             return len(text)
@@ -34,6 +73,14 @@ def count_tokens(text: str, method: str = "character") -> int:
         raise ValueError(f"Unsupported token counting method: {method}")
 
 
+# Chinese sentence endings: 。！？；
+# Also include English punctuation for mixed content
+_SENTENCE_ENDINGS = frozenset('。！？；.!?;')
+
+# Closing quotes/brackets that stay attached to the preceding sentence
+_CLOSING_QUOTE_BRACKETS = frozenset('"）)】]》>')
+
+
 def split_chinese_sentences(text: str) -> List[str]:
     """
     Split Chinese text into sentences using Chinese punctuation, preserving sentence integrity.
@@ -47,35 +94,35 @@ def split_chinese_sentences(text: str) -> List[str]:
     if not text.strip():
         return []
 
-    # Chinese sentence endings: 。！？；
-    # Also include English punctuation for mixed content
-    sentence_endings = ['。', '！', '？', '；', '.', '!', '?', ';']
-
     sentences = []
-    current_sentence = ""
+    current_chars = []
+    # Total length of the sentences emitted so far; the look-ahead below
+    # starts from this offset plus the length of the current sentence
+    consumed = 0
+    text_len = len(text)
 
     for char in text:
-        current_sentence += char
+        current_chars.append(char)
 
         # Check if this character is a sentence ending
-        if char in sentence_endings:
-            # Look ahead to see if there are quotes or brackets that should be included
-            remaining_text = text[len(''.join(sentences)) + len(current_sentence):]
-
+        if char in _SENTENCE_ENDINGS:
             # Include closing quotes/brackets that immediately follow
-            quote_bracket_chars = ['"', '"', '）', ')', '】', ']', '》', '>']
-            while remaining_text and remaining_text[0] in quote_bracket_chars:
-                current_sentence += remaining_text[0]
-                remaining_text = remaining_text[1:]
+            pos = consumed + len(current_chars)
+            while pos < text_len and text[pos] in _CLOSING_QUOTE_BRACKETS:
+                current_chars.append(text[pos])
+                pos += 1
 
             # Add the complete sentence
-            if current_sentence.strip():
-                sentences.append(current_sentence.strip())
-            current_sentence = ""
+            sentence = ''.join(current_chars).strip()
+            if sentence:
+                sentences.append(sentence)
+                consumed += len(sentence)
+            current_chars = []
 
     # Add any remaining text as the last sentence
-    if current_sentence.strip():
-        sentences.append(current_sentence.strip())
+    sentence = ''.join(current_chars).strip()
+    if sentence:
+        sentences.append(sentence)
 
     # Filter out very short fragments (likely punctuation artifacts)
     sentences = [s for s in sentences if len(s.strip()) > 2]
@@ -575,6 +622,33 @@ def clean_text(text: str) -> str:
     return '\n'.join(cleaned_lines)
 
 
+# Heading patterns tried in priority order as one anchored alternation;
+# the named group that matched determines the level.
+_HEADING_LEVEL_RE = re.compile(
+    # Chinese chapter/section patterns
+    r'(?P<chapter>第[一二三四五六七八九十\d]+章)'
+    r'|(?P<section>第[一二三四五六七八九十\d]+节)'
+    r'|(?P<numbered_item>[一二三四五六七八九十]+[、．.]|\d+[、．])'
+    r'|(?P<parenthetical>（[一二三四五六七八九十\d]+）)'
+    # English patterns
+    r'|(?P<en_chapter>(?i:chapter)\s+\d+)'
+    r'|(?P<en_section>(?i:section)\s+\d+)'
+    r'|(?P<decimal>\d+\.\d+)'
+    r'|(?P<numbered>\d+\.\s)'
+)
+
+_HEADING_GROUP_LEVELS = {
+    'chapter': 1,        # Chapter
+    'section': 2,        # Section
+    'numbered_item': 3,  # Numbered item
+    'parenthetical': 4,  # Parenthetical item
+    'en_chapter': 1,
+    'en_section': 2,
+    'decimal': 4,
+    'numbered': 3,
+}
+
+
 def detect_heading_level(text: str) -> int:
     """
     Detect heading level based on text patterns.
@@ -585,27 +659,9 @@ def detect_heading_level(text: str) -> int:
     Returns:
         Heading level (1-6)
     """
-    text = text.strip()
-    
-    # Chinese chapter/section patterns
-    if re.match(r'^第[一二三四五六七八九十\d]+章', text):
-        return 1  # Chapter
-    elif re.match(r'^第[一二三四五六七八九十\d]+节', text):
-        return 2  # Section
-    elif re.match(r'^[一二三四五六七八九十]+[、．.]', text) or re.match(r'^\d+[、．]', text):
-        return 3  # Numbered item
-    elif re.match(r'^（[一二三四五六七八九十\d]+）', text):
-        return 4  # Parenthetical item
-    
-    # English patterns
-    elif re.match(r'^Chapter\s+\d+', text, re.IGNORECASE):
-        return 1
-    elif re.match(r'^Section\s+\d+', text, re.IGNORECASE):
-        return 2
-    elif re.match(r'^\d+\.\d+', text):
-        return 4
-    elif re.match(r'^\d+\.\s', text):
-        return 3
+    match = _HEADING_LEVEL_RE.match(text.strip())
+    if match:
+        return _HEADING_GROUP_LEVELS[match.lastgroup]
     
     # Default
     return 3
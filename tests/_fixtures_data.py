@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+测试数据构造函数
+
+供conftest中的fixtures和可独立运行的测试脚本共用，
+避免测试模块直接从conftest导入。
+"""
+
+import logging
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+
+def create_law_articles_excel_file():
+    """
+    创建测试用的Excel文件，模拟法规名称-条文-内容格式
+
+    Returns:
+        临时文件路径，openpyxl未安装时返回None
+    """
+    try:
+        from openpyxl import Workbook
+        
+        # 创建只写模式工作簿，按行流式写入
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("法律条文")
+        
+        # 添加标题行
+        ws.append(["法规名称", "条文内容"])
+
+        # 添加测试数据（2列格式：法规名称 + 条文内容）
+        test_data = [
+            ["中华人民共和国工业产品生产许可证管理条例", "第一条 为了保证直接关系公共安全、人体健康、生命财产安全的重要工业产品的质量安全，贯彻国家产业政策，促进经济社会发展，制定本条例。"],
+            ["中华人民共和国工业产品生产许可证管理条例", "第二条 国家对直接关系公共安全、人体健康、生命财产安全的重要工业产品，实行生产许可证制度。"],
+            ["中华人民共和国工业产品生产许可证管理条例", "第三条 企业未依照本条例规定取得生产许可证的，不得生产列入目录的产品。任何单位和个人不得销售或者在经营活动中使用未取得生产许可证的列入目录的产品。"],
+            ["中华人民共和国工业产品生产许可证管理条例", "第四条 国务院质量技术监督部门负责全国工业产品生产许可证统一管理工作。国务院有关部门在各自的职责范围内负责相关工业产品生产许可证管理工作。"],
+            ["中华人民共和国工业产品生产许可证管理条例", "第五条 县级以上地方质量技术监督部门负责本行政区域内工业产品生产许可证管理工作。"],
+        ]
+
+        # 写入数据
+        for row in test_data:
+            ws.append(row)
+        
+        # 直接保存到已打开的临时文件
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
+            wb.save(temp_file)
+        
+        return temp_file.name
+        
+    except ImportError:
+        logger.warning("openpyxl未安装，无法创建测试Excel文件")
+        return None
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+调试脚本共享的pytest fixtures
+
+debug_*.py 中的调试函数都基于同一个测试文档。这里用session级fixture
+只转换一次.doc、只解析一次Document、只提取一次elements，
+所有调试用例共享这些结果。调试脚本不参与默认收集，
+需要时显式运行，例如 pytest tests/debug_table_structure.py。
+
+法律条文提取测试共用的Excel文件也在这里按会话创建一次。
+"""
+
+import os
+import sys
+from contextlib import suppress
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from _fixtures_data import create_law_articles_excel_file
+
+
+TEST_DOC_FILE = "output/【立项申请】首创证券新增代销机构广州农商行的立项申请.doc"
+
+
+def load_test_document(file_path=TEST_DOC_FILE):
+    """
+    转换并解析测试文档
+
+    Returns:
+        python-docx Document对象
+    """
+    from contract_splitter.converter import DocumentConverter
+    from docx import Document
+
+    converter = DocumentConverter(cleanup_temp_files=False)  # 不清理，方便调试
+    docx_path = converter.convert_to_docx(file_path)
+    return Document(docx_path)
+
+
+@pytest.fixture(scope="session")
+def doc_file():
+    """测试文档路径，文件不存在时跳过"""
+    if not os.path.exists(TEST_DOC_FILE):
+        pytest.skip(f"测试文件不存在: {TEST_DOC_FILE}")
+    return TEST_DOC_FILE
+
+
+@pytest.fixture(scope="session")
+def splitter():
+    """共享的DocxSplitter"""
+    # 在fixture内导入，收集测试时不加载contract_splitter
+    from contract_splitter.docx_splitter import DocxSplitter
+
+    return DocxSplitter(max_tokens=2000, overlap=200)
+
+
+@pytest.fixture(scope="session")
+def doc(doc_file):
+    """转换并解析一次的测试文档"""
+    return load_test_document(doc_file)
+
+
+@pytest.fixture(scope="session")
+def elements(splitter, doc):
+    """提取一次的文档elements"""
+    return splitter._extract_elements(doc)
+
+
+@pytest.fixture(scope="session")
+def law_articles_excel_file():
+    """法律条文提取测试共用的Excel文件，会话结束时删除"""
+    test_file = create_law_articles_excel_file()
+    if not test_file:
+        pytest.skip("无法创建测试Excel文件")
+    yield test_file
+    with suppress(FileNotFoundError):
+        os.unlink(test_file)
@@ -8,35 +8,16 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from contract_splitter.docx_splitter import DocxSplitter
+from conftest import TEST_DOC_FILE, load_test_document
 
 
-def debug_elements_structure():
+def debug_elements_structure(splitter, elements):
     """调试elements结构"""
     print("🔍 调试elements结构")
     print("=" * 80)
     
-    test_file = "output/【立项申请】首创证券新增代销机构广州农商行的立项申请.doc"
-    
-    if not os.path.exists(test_file):
-        print(f"❌ 测试文件不存在: {test_file}")
-        return
-    
-    # 创建DocxSplitter
-    splitter = DocxSplitter(max_tokens=2000, overlap=200)
-    
     print("📄 调用_extract_elements方法")
     try:
-        # 直接调用内部方法来查看elements
-        from contract_splitter.converter import DocumentConverter
-        
-        converter = DocumentConverter(cleanup_temp_files=False)
-        docx_path = converter.convert_to_docx(test_file)
-        
-        from docx import Document
-        doc = Document(docx_path)
-        
-        elements = splitter._extract_elements(doc)
-        
         print(f"✅ 提取了 {len(elements)} 个elements")
         
         # 分析每个element
@@ -71,12 +52,23 @@ def debug_elements_structure():
         traceback.print_exc()
 
 
+def test_elements_structure(splitter, elements):
+    """pytest入口，复用conftest中session级的fixtures"""
+    debug_elements_structure(splitter, elements)
+
+
 def main():
     """主函数"""
     print("🚀 Elements结构调试")
     print("=" * 80)
     
-    debug_elements_structure()
+    if not os.path.exists(TEST_DOC_FILE):
+        print(f"❌ 测试文件不存在: {TEST_DOC_FILE}")
+    else:
+        splitter = DocxSplitter(max_tokens=2000, overlap=200)
+        doc = load_test_document()
+        elements = splitter._extract_elements(doc)
+        debug_elements_structure(splitter, elements)
     
     print("\n" + "=" * 80)
     print("🎯 调试完成")
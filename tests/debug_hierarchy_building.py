@@ -3,113 +3,121 @@
 调试hierarchy building过程
 """
 
+import logging
 import os
 import sys
+from operator import itemgetter
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from contract_splitter.docx_splitter import DocxSplitter
+from conftest import TEST_DOC_FILE, load_test_document
 
 
-def debug_hierarchy_building():
+# element字段的默认值，合并后用itemgetter一次取出，避免每个字段单独调用.get
+ELEMENT_DEFAULTS = {'text': '', 'is_heading': False, 'level': None, 'type': 'N/A', 'source': ''}
+element_fields = itemgetter('text', 'is_heading', 'level', 'type', 'source')
+
+
+# 逐元素的详细输出走logging，级别不够时跳过格式化（LOG_LEVEL=WARNING 可关闭）
+logger = logging.getLogger(__name__)
+
+
+def log_content_elements(texts, levels, start, end, section):
+    """逐个输出归入section的内容element，长度按逐条追加时的累计值计算"""
+    length = 0
+    for i in range(start, end):
+        level = levels[i]
+        logger.debug("\n--- Processing Element %s ---", i)
+        logger.debug("is_heading: False")
+        logger.debug("level: %s", 'N/A' if level is None else level)
+        logger.debug("text: %s...", texts[i][:50])
+        logger.debug("  → Adding content to current section")
+        logger.debug("  → Current section exists: %s...", section['heading'][:30])
+        length += len(texts[i]) + (2 if i > start else 0)
+        logger.debug("  → %s, length: %s", 'Appended content' if i > start else 'Set content', length)
+
+
+def debug_hierarchy_building(splitter, elements):
     """调试hierarchy building过程"""
     print("🔍 调试hierarchy building过程")
     print("=" * 80)
     
-    test_file = "output/【立项申请】首创证券新增代销机构广州农商行的立项申请.doc"
-    
-    if not os.path.exists(test_file):
-        print(f"❌ 测试文件不存在: {test_file}")
-        return
-    
-    # 创建DocxSplitter
-    splitter = DocxSplitter(max_tokens=2000, overlap=200)
-    
     print("📄 步骤1: 提取elements")
     try:
-        from contract_splitter.converter import DocumentConverter
-        
-        converter = DocumentConverter(cleanup_temp_files=False)
-        docx_path = converter.convert_to_docx(test_file)
-        
-        from docx import Document
-        doc = Document(docx_path)
-        
-        elements = splitter._extract_elements(doc)
-        
         print(f"✅ 提取了 {len(elements)} 个elements")
         
         # 重点关注table cell elements
         table_cell_elements = []
+        verbose = logger.isEnabledFor(logging.DEBUG)
         for i, elem in enumerate(elements):
-            if elem.get('source', '').startswith('table_cell'):
+            text, is_heading, level, elem_type, source = element_fields({**ELEMENT_DEFAULTS, **elem})
+            if source.startswith('table_cell'):
                 table_cell_elements.append((i, elem))
-                print(f"\n📋 Table Cell Element {i}:")
-                print(f"   text length: {len(elem.get('text', ''))}")
-                print(f"   text preview: {elem.get('text', '')[:100]}...")
-                print(f"   is_heading: {elem.get('is_heading', False)}")
-                print(f"   level: {elem.get('level', 'N/A')}")
-                print(f"   type: {elem.get('type', 'N/A')}")
-                print(f"   source: {elem.get('source', 'N/A')}")
+                if verbose:
+                    logger.debug("\n📋 Table Cell Element %s:", i)
+                    logger.debug("   text length: %s", len(text))
+                    logger.debug("   text preview: %s...", text[:100])
+                    logger.debug("   is_heading: %s", is_heading)
+                    logger.debug("   level: %s", 'N/A' if level is None else level)
+                    logger.debug("   type: %s", elem_type)
+                    logger.debug("   source: %s", source)
         
         print(f"\n📄 步骤2: 手动调试_build_hierarchy")
         
         # 手动模拟_build_hierarchy的关键部分
+        # 先把elements拆成并列的字段列表，只有标题位置参与控制流
+        fields = [element_fields({**ELEMENT_DEFAULTS, **element}) for element in elements]
+        texts = [f[0] for f in fields]
+        levels = [f[2] for f in fields]
+        heading_indices = [i for i, f in enumerate(fields) if f[1]]
+        print(f"标题数: {len(heading_indices)} / elements数: {len(elements)}")
+        
         sections = []
         current_section = None
-        section_stack = []
         
-        for i, element in enumerate(elements):
-            print(f"\n--- Processing Element {i} ---")
-            print(f"is_heading: {element.get('is_heading', False)}")
-            print(f"level: {element.get('level', 'N/A')}")
-            print(f"text: {element.get('text', '')[:50]}...")
+        # 第一个标题之前的内容归入默认section
+        first_heading = heading_indices[0] if heading_indices else len(elements)
+        if first_heading > 0:
+            print(f"\n--- Elements 0-{first_heading - 1}: 无标题内容 ---")
+            print("  → Creating default section")
+            current_section = {
+                'heading': 'Document Content',
+                'content': '\n\n'.join(texts[:first_heading]),
+                'level': 1,
+                'subsections': []
+            }
+            sections.append(current_section)
+            print(f"  → Set content, length: {len(current_section['content'])}")
+            if verbose:
+                log_content_elements(texts, levels, 0, first_heading, current_section)
+        
+        # 每个标题的内容是它与下一个标题之间的所有elements
+        for hi, next_hi in zip(heading_indices, heading_indices[1:] + [len(elements)]):
+            level = levels[hi]
+            if verbose:
+                logger.debug("\n--- Processing Element %s ---", hi)
+                logger.debug("is_heading: True")
+                logger.debug("level: %s", 'N/A' if level is None else level)
+                logger.debug("text: %s...", texts[hi][:50])
+            
+            section = {
+                'heading': texts[hi],
+                'content': '\n\n'.join(texts[hi + 1:next_hi]),
+                'level': 1 if level is None else level,
+                'subsections': []
+            }
             
-            if element.get('is_heading', False):
-                print("  → Creating new section (heading)")
-                section = {
-                    'heading': element['text'],
-                    'content': '',
-                    'level': element.get('level', 1),
-                    'subsections': []
-                }
-                
-                # 简化的层次处理
-                if not sections:
-                    sections.append(section)
-                    current_section = section
-                    section_stack = [section]
-                else:
-                    # 添加为subsection
-                    if current_section:
-                        current_section['subsections'].append(section)
-                    else:
-                        sections.append(section)
-                    current_section = section
-                    section_stack.append(section)
-                
-                print(f"  → Current section: {section['heading'][:30]}...")
+            # 简化的层次处理：后续标题都作为前一个section的subsection
+            if current_section is None:
+                sections.append(section)
             else:
-                print("  → Adding content to current section")
-                if current_section is not None:
-                    print(f"  → Current section exists: {current_section['heading'][:30]}...")
-                    if current_section['content']:
-                        current_section['content'] += '\n\n' + element['text']
-                        print(f"  → Appended content, new length: {len(current_section['content'])}")
-                    else:
-                        current_section['content'] = element['text']
-                        print(f"  → Set content, length: {len(current_section['content'])}")
-                else:
-                    print("  → No current section!")
-                    if not sections:
-                        print("  → Creating default section")
-                        sections.append({
-                            'heading': 'Document Content',
-                            'content': element['text'],
-                            'level': 1,
-                            'subsections': []
-                        })
-                        current_section = sections[0]
-                        section_stack = [current_section]
+                current_section['subsections'].append(section)
+            current_section = section
+            
+            if verbose:
+                logger.debug("  → Current section: %s...", section['heading'][:30])
+                logger.debug("  → Content elements: %s, length: %s", next_hi - hi - 1, len(section['content']))
+                log_content_elements(texts, levels, hi + 1, next_hi, section)
         
         print(f"\n📄 步骤3: 分析最终sections")
         for i, section in enumerate(sections):
@@ -128,12 +136,25 @@ def debug_hierarchy_building():
         traceback.print_exc()
 
 
+def test_hierarchy_building(splitter, elements):
+    """pytest入口，复用conftest中session级的fixtures"""
+    debug_hierarchy_building(splitter, elements)
+
+
 def main():
     """主函数"""
+    logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'DEBUG').upper(), format='%(message)s')
+    
     print("🚀 Hierarchy Building调试")
     print("=" * 80)
     
-    debug_hierarchy_building()
+    if not os.path.exists(TEST_DOC_FILE):
+        print(f"❌ 测试文件不存在: {TEST_DOC_FILE}")
+    else:
+        splitter = DocxSplitter(max_tokens=2000, overlap=200)
+        doc = load_test_document()
+        elements = splitter._extract_elements(doc)
+        debug_hierarchy_building(splitter, elements)
     
     print("\n" + "=" * 80)
     print("🎯 调试完成")
@@ -8,37 +8,22 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from contract_splitter.docx_splitter import DocxSplitter
+from conftest import TEST_DOC_FILE, load_test_document
 
 
-def debug_missing_content():
+def debug_missing_content(splitter, doc, doc_file):
     """调试丢失的内容"""
     print("🔍 调试丢失的内容")
     print("=" * 80)
     
-    test_file = "output/【立项申请】首创证券新增代销机构广州农商行的立项申请.doc"
-    
-    if not os.path.exists(test_file):
-        print(f"❌ 测试文件不存在: {test_file}")
-        return
-    
-    # 创建DocxSplitter
-    splitter = DocxSplitter(max_tokens=2000, overlap=200)
-    
     print("📄 提取完整文档内容")
     try:
-        from contract_splitter.converter import DocumentConverter
-        
-        converter = DocumentConverter(cleanup_temp_files=False)
-        docx_path = converter.convert_to_docx(test_file)
-        
-        from docx import Document
-        doc = Document(docx_path)
-        
-        # 提取所有文本内容
-        all_text = ""
+        # 提取所有文本内容，先收集到列表再一次性拼接
+        text_parts = []
         for para in doc.paragraphs:
-            if para.text.strip():
-                all_text += para.text.strip() + "\n"
+            para_text = para.text.strip()
+            if para_text:
+                text_parts.append(para_text)
         
         # 提取表格内容
         for table in doc.tables:
@@ -46,7 +31,9 @@ def debug_missing_content():
                 for cell in row.cells:
                     cell_content = splitter._extract_nested_tables_from_cell(cell)
                     if cell_content and cell_content.strip():
-                        all_text += cell_content.strip() + "\n"
+                        text_parts.append(cell_content.strip())
+        
+        all_text = "".join(part + "\n" for part in text_parts)
         
         print(f"📊 完整文档长度: {len(all_text)} 字符")
         
@@ -79,7 +66,7 @@ def debug_missing_content():
         
         # 现在测试分割
         print(f"\n📄 测试文档分割")
-        sections = splitter.split(test_file)
+        sections = splitter.split(doc_file)
         
         print(f"📊 分割结果: {len(sections)} 个sections")
         
@@ -108,12 +95,13 @@ def debug_missing_content():
                 print(f"   ❌ 不包含任何丢失的内容")
 
         # 合并所有section内容检查
-        all_section_content = ""
+        section_parts = []
         for section in sections:
             if hasattr(section, 'title'):
-                all_section_content += section.title + "\n" + section.content + "\n"
+                section_parts.append(section.title + "\n" + section.content + "\n")
             else:
-                all_section_content += section.get('title', '') + "\n" + section.get('content', '') + "\n"
+                section_parts.append(section.get('title', '') + "\n" + section.get('content', '') + "\n")
+        all_section_content = "".join(section_parts)
         
         print(f"\n📊 所有sections合并长度: {len(all_section_content)} 字符")
         print(f"📊 原文档长度: {len(all_text)} 字符")
@@ -132,12 +120,22 @@ def debug_missing_content():
         traceback.print_exc()
 
 
+def test_missing_content(splitter, doc, doc_file):
+    """pytest入口，复用conftest中session级的fixtures"""
+    debug_missing_content(splitter, doc, doc_file)
+
+
 def main():
     """主函数"""
     print("🚀 内容丢失调试")
     print("=" * 80)
     
-    debug_missing_content()
+    if not os.path.exists(TEST_DOC_FILE):
+        print(f"❌ 测试文件不存在: {TEST_DOC_FILE}")
+    else:
+        splitter = DocxSplitter(max_tokens=2000, overlap=200)
+        doc = load_test_document()
+        debug_missing_content(splitter, doc, TEST_DOC_FILE)
     
     print("\n" + "=" * 80)
     print("🎯 调试完成")
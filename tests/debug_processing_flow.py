@@ -3,6 +3,7 @@
 调试完整的处理流程
 """
 
+import logging
 import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -10,6 +11,10 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from contract_splitter.docx_splitter import DocxSplitter
 
 
+# 逐元素的详细输出走logging，级别不够时跳过格式化（LOG_LEVEL=WARNING 可关闭）
+logger = logging.getLogger(__name__)
+
+
 def debug_processing_flow():
     """调试完整的处理流程"""
     print("🔍 调试完整的处理流程")
@@ -30,39 +35,40 @@ def debug_processing_flow():
         print(f"✅ 得到 {len(sections)} 个sections")
         
         # 分析每个section
-        for i, section in enumerate(sections):
-            print(f"\n📋 Section {i+1}:")
-            print(f"   标题: {section.get('heading', 'N/A')}")
-            print(f"   内容长度: {len(section.get('content', ''))}")
-            print(f"   子章节数: {len(section.get('subsections', []))}")
+        verbose = logger.isEnabledFor(logging.DEBUG)
+        for i, section in enumerate(sections if verbose else ()):
+            logger.debug("\n📋 Section %s:", i + 1)
+            logger.debug("   标题: %s", section.get('heading', 'N/A'))
+            logger.debug("   内容长度: %s", len(section.get('content', '')))
+            logger.debug("   子章节数: %s", len(section.get('subsections', [])))
             
             content = section.get('content', '')
             if content:
                 preview = content[:200].replace('\n', ' ')
-                print(f"   内容预览: {preview}...")
+                logger.debug("   内容预览: %s...", preview)
                 
                 # 检查是否包含关键内容
                 if "一、项目名称" in content:
-                    print(f"   ✅ 包含项目名称")
+                    logger.debug("   ✅ 包含项目名称")
                 if "广州金融控股" in content:
-                    print(f"   ✅ 包含股东信息")
+                    logger.debug("   ✅ 包含股东信息")
         
         print(f"\n📄 步骤2: 调用flatten方法")
         chunks = splitter.flatten(sections)
         print(f"✅ 得到 {len(chunks)} 个chunks")
         
         # 分析每个chunk
-        for i, chunk in enumerate(chunks):
-            print(f"\n📋 Chunk {i+1}:")
-            print(f"   长度: {len(chunk)} 字符")
+        for i, chunk in enumerate(chunks if verbose else ()):
+            logger.debug("\n📋 Chunk %s:", i + 1)
+            logger.debug("   长度: %s 字符", len(chunk))
             
             if "一、项目名称" in chunk:
-                print(f"   ✅ 包含项目名称")
+                logger.debug("   ✅ 包含项目名称")
             if "广州金融控股" in chunk:
-                print(f"   ✅ 包含股东信息")
+                logger.debug("   ✅ 包含股东信息")
             
             preview = chunk[:200].replace('\n', ' ')
-            print(f"   预览: {preview}...")
+            logger.debug("   预览: %s...", preview)
         
     except Exception as e:
         print(f"❌ 处理失败: {e}")
@@ -72,6 +78,8 @@ def debug_processing_flow():
 
 def main():
     """主函数"""
+    logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'DEBUG').upper(), format='%(message)s')
+    
     print("🚀 处理流程调试")
     print("=" * 80)
     
@@ -5,11 +5,17 @@
 
 import os
 import sys
+from operator import itemgetter
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from contract_splitter.docx_splitter import DocxSplitter
 
 
+# section字段的默认值，合并后用itemgetter一次取出
+SECTION_DEFAULTS = {'heading': 'N/A', 'content': '', 'subsections': None}
+section_fields = itemgetter('heading', 'content', 'subsections')
+
+
 def debug_subsections():
     """调试subsections内容"""
     print("🔍 调试subsections内容")
@@ -30,26 +36,28 @@ def debug_subsections():
         
         print(f"✅ 得到 {len(sections)} 个sections")
         
-        def print_section_tree(section_list, indent=0):
-            """递归打印section树结构"""
-            for i, section in enumerate(section_list):
+        def print_section_tree(section_list):
+            """用显式栈按先序遍历打印section树结构"""
+            stack = [(section, 0, i) for i, section in reversed(list(enumerate(section_list)))]
+            while stack:
+                section, indent, i = stack.pop()
                 prefix = "  " * indent
-                heading = section.get('heading', 'N/A')
-                content_length = len(section.get('content', ''))
-                subsections_count = len(section.get('subsections', []))
+                heading, content, subsections = section_fields({**SECTION_DEFAULTS, **section})
+                content_length = len(content)
+                subsections = subsections or []
                 
                 print(f"{prefix}📋 Section {i+1}: {heading[:50]}...")
                 print(f"{prefix}   Content length: {content_length}")
-                print(f"{prefix}   Subsections: {subsections_count}")
+                print(f"{prefix}   Subsections: {len(subsections)}")
                 
                 if content_length > 0:
-                    content_preview = section['content'][:200].replace('\n', ' ')
+                    content_preview = content[:200].replace('\n', ' ')
                     print(f"{prefix}   Content preview: {content_preview}...")
                 
-                # 递归处理subsections
-                if section.get('subsections'):
+                # 子节点逆序入栈，保证按原顺序出栈
+                if subsections:
                     print(f"{prefix}   Subsections:")
-                    print_section_tree(section['subsections'], indent + 1)
+                    stack.extend((sub, indent + 1, j) for j, sub in reversed(list(enumerate(subsections))))
         
         print("\n📊 完整的sections树结构:")
         print_section_tree(sections)
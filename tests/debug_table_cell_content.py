@@ -8,32 +8,16 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from contract_splitter.docx_splitter import DocxSplitter
+from conftest import TEST_DOC_FILE, load_test_document
 
 
-def debug_table_cell_content():
+def debug_table_cell_content(splitter, doc):
     """调试table cell内容"""
     print("🔍 调试table cell内容")
     print("=" * 80)
     
-    test_file = "output/【立项申请】首创证券新增代销机构广州农商行的立项申请.doc"
-    
-    if not os.path.exists(test_file):
-        print(f"❌ 测试文件不存在: {test_file}")
-        return
-    
-    # 创建DocxSplitter
-    splitter = DocxSplitter(max_tokens=2000, overlap=200)
-    
     print("📄 提取table cell内容")
     try:
-        from contract_splitter.converter import DocumentConverter
-        
-        converter = DocumentConverter(cleanup_temp_files=False)
-        docx_path = converter.convert_to_docx(test_file)
-        
-        from docx import Document
-        doc = Document(docx_path)
-        
         # 找到包含大内容的table cell
         for table_idx, table in enumerate(doc.tables):
             print(f"\n📋 Table {table_idx + 1}:")
@@ -76,12 +60,22 @@ def debug_table_cell_content():
         traceback.print_exc()
 
 
+def test_table_cell_content(splitter, doc):
+    """pytest入口，复用conftest中session级的fixtures"""
+    debug_table_cell_content(splitter, doc)
+
+
 def main():
     """主函数"""
     print("🚀 Table Cell内容调试")
     print("=" * 80)
     
-    debug_table_cell_content()
+    if not os.path.exists(TEST_DOC_FILE):
+        print(f"❌ 测试文件不存在: {TEST_DOC_FILE}")
+    else:
+        splitter = DocxSplitter(max_tokens=2000, overlap=200)
+        doc = load_test_document()
+        debug_table_cell_content(splitter, doc)
     
     print("\n" + "=" * 80)
     print("🎯 调试完成")
@@ -4,86 +4,102 @@
 """
 
 import os
+import re
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from contract_splitter.docx_splitter import DocxSplitter
+from conftest import TEST_DOC_FILE, load_test_document
 
 
-def debug_table_cell_split():
+# 一级层次标记（一、至八、），单次扫描即可找到所有位置
+HIERARCHY_MARKER_RE = re.compile(r'[一二三四五六七八]、')
+
+# 提取后的cell内容超过该长度才算"大cell"
+BIG_CELL_MIN_CHARS = 3000
+# 粗筛阈值：提取结果的长度可能与原始文本不同（如加入分隔符），须留出余量低于BIG_CELL_MIN_CHARS，避免漏掉大cell
+BIG_CELL_PREFILTER_CHARS = 2500
+
+
+def cell_text_length(cell):
+    """
+    cell内全部文本的长度，包括嵌套表格中的文本
+    
+    python-docx的cell.text只包含cell直属段落，这里统计底层XML中的全部w:t节点
+    """
+    return sum(len(t.text or '') for t in cell._tc.xpath('.//w:t'))
+
+
+def debug_table_cell_split(splitter, doc):
     """调试table cell分割过程"""
     print("🔍 调试table cell分割过程")
     print("=" * 80)
     
-    test_file = "output/【立项申请】首创证券新增代销机构广州农商行的立项申请.doc"
-    
-    if not os.path.exists(test_file):
-        print(f"❌ 测试文件不存在: {test_file}")
-        return
-    
-    # 创建DocxSplitter
-    splitter = DocxSplitter(max_tokens=2000, overlap=200)
-    
     print("📄 提取大table cell内容并测试分割")
     try:
-        from contract_splitter.converter import DocumentConverter
+        # 找到第一个包含大内容的table cell：先用cell全部文本的长度粗筛，
+        # 只对候选cell做嵌套表格提取，找到后立即停止扫描
+        candidates = (
+            (table_idx, i, j, cell)
+            for table_idx, table in enumerate(doc.tables)
+            for i, row in enumerate(table.rows)
+            for j, cell in enumerate(row.cells)
+            if cell_text_length(cell) > BIG_CELL_PREFILTER_CHARS
+        )
+        extracted = (
+            (table_idx, i, j, splitter._extract_nested_tables_from_cell(cell))
+            for table_idx, i, j, cell in candidates
+        )
+        big_cell = next(
+            ((table_idx, i, j, content) for table_idx, i, j, content in extracted
+             if content and len(content) > BIG_CELL_MIN_CHARS),
+            None
+        )
         
-        converter = DocumentConverter(cleanup_temp_files=False)
-        docx_path = converter.convert_to_docx(test_file)
+        if big_cell is None:
+            print("❌ 未找到大cell")
+            return
         
-        from docx import Document
-        doc = Document(docx_path)
+        table_idx, i, j, cell_content = big_cell
+        print(f"\n📋 Table {table_idx + 1}:")
+        print(f"\n🎯 找到大cell ({i+1},{j+1}): {len(cell_content)} 字符")
         
-        # 找到包含大内容的table cell
-        for table_idx, table in enumerate(doc.tables):
-            print(f"\n📋 Table {table_idx + 1}:")
-            for i, row in enumerate(table.rows):
-                for j, cell in enumerate(row.cells):
-                    cell_content = splitter._extract_nested_tables_from_cell(cell)
-                    
-                    if cell_content and len(cell_content) > 3000:
-                        print(f"\n🎯 找到大cell ({i+1},{j+1}): {len(cell_content)} 字符")
-                        
-                        # 显示前500字符
-                        print(f"前500字符: {cell_content[:500]}...")
-                        
-                        # 测试_split_cell_content_as_document方法
-                        print(f"\n🔧 测试_split_cell_content_as_document:")
-                        elements = splitter._split_cell_content_as_document(cell_content, i, j)
-                        print(f"分割后elements数量: {len(elements)}")
-                        
-                        for k, elem in enumerate(elements):
-                            print(f"\n  Element {k+1}:")
-                            print(f"    is_heading: {elem.get('is_heading')}")
-                            print(f"    level: {elem.get('level')}")
-                            print(f"    text length: {len(elem.get('text', ''))}")
-                            text_preview = elem.get('text', '')[:100].replace('\n', ' ')
-                            print(f"    text preview: {text_preview}...")
-                        
-                        # 测试_is_clear_heading_line方法
-                        print(f"\n🔧 测试_is_clear_heading_line:")
-                        lines = [line.strip() for line in cell_content.split('\n') if line.strip()]
-                        print(f"总行数: {len(lines)}")
-                        
-                        heading_lines = []
-                        for line_idx, line in enumerate(lines[:10]):  # 只检查前10行
-                            is_heading = splitter._is_clear_heading_line(line)
-                            print(f"  行{line_idx+1} ({len(line)}字符): {is_heading} - {line[:50]}...")
-                            if is_heading:
-                                heading_lines.append(line)
-                        
-                        print(f"识别为标题的行数: {len(heading_lines)}")
-                        
-                        # 测试层次检测
-                        print(f"\n🔧 测试层次标记检测:")
-                        hierarchy_markers = ['一、', '二、', '三、', '四、', '五、', '六、', '七、', '八、']
-                        for marker in hierarchy_markers:
-                            if marker in cell_content:
-                                pos = cell_content.find(marker)
-                                context = cell_content[max(0, pos-20):pos+50]
-                                print(f"  找到 '{marker}' at position {pos}: ...{context}...")
-                        
-                        return  # 只处理第一个大cell
+        # 显示前500字符
+        print(f"前500字符: {cell_content[:500]}...")
+        
+        # 测试_split_cell_content_as_document方法
+        print(f"\n🔧 测试_split_cell_content_as_document:")
+        elements = splitter._split_cell_content_as_document(cell_content, i, j)
+        print(f"分割后elements数量: {len(elements)}")
+        
+        for k, elem in enumerate(elements):
+            print(f"\n  Element {k+1}:")
+            print(f"    is_heading: {elem.get('is_heading')}")
+            print(f"    level: {elem.get('level')}")
+            print(f"    text length: {len(elem.get('text', ''))}")
+            text_preview = elem.get('text', '')[:100].replace('\n', ' ')
+            print(f"    text preview: {text_preview}...")
+        
+        # 测试_is_clear_heading_line方法
+        print(f"\n🔧 测试_is_clear_heading_line:")
+        lines = [line.strip() for line in cell_content.split('\n') if line.strip()]
+        print(f"总行数: {len(lines)}")
+        
+        # 只检查前10行，先批量分类再输出
+        checked_lines = lines[:10]
+        heading_flags = list(map(splitter._is_clear_heading_line, checked_lines))
+        heading_lines = [line for line, is_heading in zip(checked_lines, heading_flags) if is_heading]
+        for line_idx, (line, is_heading) in enumerate(zip(checked_lines, heading_flags)):
+            print(f"  行{line_idx+1} ({len(line)}字符): {is_heading} - {line[:50]}...")
+        
+        print(f"识别为标题的行数: {len(heading_lines)}")
+        
+        # 测试层次检测
+        print(f"\n🔧 测试层次标记检测:")
+        for match in HIERARCHY_MARKER_RE.finditer(cell_content):
+            pos = match.start()
+            context = cell_content[max(0, pos-20):pos+50]
+            print(f"  找到 '{match.group()}' at position {pos}: ...{context}...")
         
     except Exception as e:
         print(f"❌ 处理失败: {e}")
@@ -91,12 +107,22 @@ def debug_table_cell_split():
         traceback.print_exc()
 
 
+def test_table_cell_split(splitter, doc):
+    """pytest入口，复用conftest中session级的fixtures"""
+    debug_table_cell_split(splitter, doc)
+
+
 def main():
     """主函数"""
     print("🚀 Table Cell分割调试")
     print("=" * 80)
     
-    debug_table_cell_split()
+    if not os.path.exists(TEST_DOC_FILE):
+        print(f"❌ 测试文件不存在: {TEST_DOC_FILE}")
+    else:
+        splitter = DocxSplitter(max_tokens=2000, overlap=200)
+        doc = load_test_document()
+        debug_table_cell_split(splitter, doc)
     
     print("\n" + "=" * 80)
     print("🎯 调试完成")
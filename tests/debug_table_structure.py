@@ -5,38 +5,22 @@
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from contract_splitter.docx_splitter import DocxSplitter
-from docx import Document
+from conftest import TEST_DOC_FILE, load_test_document
 
 
-def debug_table_structure():
+def debug_table_structure(splitter, doc):
     """调试表格结构"""
     print("🔍 调试表格结构")
     print("=" * 60)
     
-    test_file = "output/【立项申请】首创证券新增代销机构广州农商行的立项申请.doc"
-    
-    if not os.path.exists(test_file):
-        print(f"❌ 测试文件不存在: {test_file}")
-        return
-    
-    # 创建DocxSplitter
-    splitter = DocxSplitter(max_tokens=1000, overlap=100)
-    
-    # 先转换文件
-    print("📄 转换.doc文件...")
+    print("📄 分析文档表格...")
     try:
-        from contract_splitter.converter import DocumentConverter
-
-        converter = DocumentConverter(cleanup_temp_files=False)  # 不清理，方便调试
-        docx_path = converter.convert_to_docx(test_file)
-        print(f"✅ 转换成功: {docx_path}")
-
-        # 打开转换后的文档
-        doc = Document(docx_path)
-        
         print(f"\n📊 文档统计:")
         print(f"   段落数: {len(doc.paragraphs)}")
         print(f"   表格数: {len(doc.tables)}")
@@ -65,30 +49,56 @@ def debug_table_structure():
                             print(f"      内容: {cell_text}")
         
         # 测试嵌套表格提取
+        def extract_row(row):
+            """提取一行中每个cell的嵌套内容，返回 (内容, 异常) 列表"""
+            results = []
+            for cell in row.cells:
+                try:
+                    results.append((splitter._extract_nested_tables_from_cell(cell), None))
+                except Exception as e:
+                    results.append((None, e))
+            return results
+
         print(f"\n🔍 测试嵌套表格提取:")
-        for table_idx, table in enumerate(doc.tables):
-            print(f"\n表格 {table_idx + 1}:")
-            for i, row in enumerate(table.rows):
-                for j, cell in enumerate(row.cells):
-                    try:
-                        nested_content = splitter._extract_nested_tables_from_cell(cell)
-                        if nested_content and len(nested_content) > 20:
+        with ThreadPoolExecutor() as executor:
+            for table_idx, table in enumerate(doc.tables):
+                print(f"\n表格 {table_idx + 1}:")
+                # 按行并行提取，结果按原顺序输出
+                for i, row_results in enumerate(executor.map(extract_row, table.rows)):
+                    for j, (nested_content, error) in enumerate(row_results):
+                        if error is not None:
+                            print(f"   Cell ({i+1},{j+1}): 提取失败 - {error}")
+                        elif nested_content and len(nested_content) > 20:
                             print(f"   Cell ({i+1},{j+1}): 嵌套内容 {len(nested_content)} 字符")
                             if "广州金融控股" in nested_content:
                                 print(f"      ✅ 包含股东信息")
-                    except Exception as e:
-                        print(f"   Cell ({i+1},{j+1}): 提取失败 - {e}")
         
     except Exception as e:
         print(f"❌ 处理失败: {e}")
 
 
+@pytest.fixture(scope="module")
+def table_splitter():
+    """本脚本使用的分割器（max_tokens=1000, overlap=100）"""
+    return DocxSplitter(max_tokens=1000, overlap=100)
+
+
+def test_table_structure(table_splitter, doc):
+    """pytest入口，复用conftest中session级的doc fixture"""
+    debug_table_structure(table_splitter, doc)
+
+
 def main():
     """主函数"""
     print("🚀 表格结构调试")
     print("=" * 80)
     
-    debug_table_structure()
+    if not os.path.exists(TEST_DOC_FILE):
+        print(f"❌ 测试文件不存在: {TEST_DOC_FILE}")
+    else:
+        splitter = DocxSplitter(max_tokens=1000, overlap=100)
+        doc = load_test_document()
+        debug_table_structure(splitter, doc)
     
     print("\n" + "=" * 80)
     print("🎯 调试完成")
@@ -8,11 +8,28 @@ import os
 import sys
 import json
 import shutil
+import argparse
+import itertools
+import logging
+import mmap
+import hashlib
+import tempfile
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack, suppress
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterable, List, Optional, Sized
+
+try:
+    import orjson  # 可选：更快的JSON序列化
+except ImportError:
+    orjson = None
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import contract_splitter
 from contract_splitter.splitter_factory import SplitterFactory, get_default_factory
 from contract_splitter.domain_helpers import (
     split_legal_document,
@@ -26,6 +43,72 @@ from contract_splitter.domain_helpers import (
 
 # WPS和PDF处理现在集成到DocxSplitter中，不需要单独的转换函数
 
+# 批量处理日志：进度信息走logger，-q时只输出警告和错误
+logger = logging.getLogger("batch_processing")
+
+# 输出中使用的分隔线
+SEPARATOR = "=" * 80
+SUB_SEPARATOR = "-" * 40
+
+# chunks输出文件的写缓冲区大小（1 MiB）
+CHUNK_WRITE_BUFFER_SIZE = 1 << 20
+
+# 按文件内容缓存拆分结果的目录，位于chunks输出目录下
+CHUNK_CACHE_DIRNAME = ".chunk_cache"
+
+# 每个文件的处理结果按目录追加写入JSONL分片，不在内存中累积；位于chunks输出目录下，汇总后删除
+RESULTS_SHARD_DIRNAME = ".results_shards"
+
+# 本脚本自己生成的目录，不作为待处理的分类目录扫描
+SKIPPED_SUBDIRS = frozenset({"chunks", CHUNK_CACHE_DIRNAME, RESULTS_SHARD_DIRNAME})
+
+# 进程内的输出文件序号
+_output_counter = itertools.count()
+
+# 批量处理支持的文件扩展名
+SUPPORTED_EXTS = frozenset({'.docx', '.doc', '.wps', '.pdf'})
+
+# 模块级工厂实例，进程池中每个worker进程只初始化一次
+_FACTORY = get_default_factory()
+
+
+@lru_cache(maxsize=32)
+def _file_info_for_ext(ext: str) -> Dict[str, Any]:
+    """
+    按扩展名缓存格式支持信息
+    
+    Args:
+        ext: 小写的文件扩展名（含点）
+        
+    Returns:
+        格式、是否支持及处理器信息
+    """
+    info = _FACTORY.get_file_info(f"file{ext}")
+    return {key: info[key] for key in ('format', 'supported', 'splitter_class', 'splitter_module')}
+
+
+# 各分类目录对应的helper配置
+DIRECTORY_HELPER_CONFIGS = {
+    "contract": {
+        "helper_type": "contract",
+        "contract_type": "general",
+        "description": "合同文件"
+    },
+    "law": {
+        "helper_type": "legal",
+        "description": "法律法规文件"
+    },
+    "rule": {
+        "helper_type": "regulation",
+        "regulation_type": "general",
+        "description": "规章制度文件"
+    },
+    "others": {
+        "helper_type": "general",
+        "description": "其他文件"
+    }
+}
+
 
 def get_directory_helper_config(directory_name: str) -> Dict[str, Any]:
     """
@@ -37,71 +120,219 @@ def get_directory_helper_config(directory_name: str) -> Dict[str, Any]:
     Returns:
         配置字典
     """
-    configs = {
-        "contract": {
-            "helper_type": "contract",
-            "contract_type": "general",
-            "description": "合同文件"
-        },
-        "law": {
-            "helper_type": "legal",
-            "description": "法律法规文件"
-        },
-        "rule": {
-            "helper_type": "regulation",
-            "regulation_type": "general",
-            "description": "规章制度文件"
-        },
-        "others": {
-            "helper_type": "general",
-            "description": "其他文件"
-        }
-    }
+    return DIRECTORY_HELPER_CONFIGS.get(directory_name, DIRECTORY_HELPER_CONFIGS["others"])
+
+
+def _configure_logging(level: int) -> None:
+    """
+    配置批量处理的日志输出，同时作为进程池worker的initializer
     
-    return configs.get(directory_name, configs["others"])
+    Args:
+        level: 日志级别
+    """
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.propagate = False
+    logger.setLevel(level)
+    # 安静模式下同时压低contract_splitter包自身的INFO日志
+    logging.getLogger("contract_splitter").setLevel(max(level, logging.INFO))
 
 
-def save_chunks_to_file(file_path: str, chunks: List[str], output_dir: str = "output/chunks") -> str:
+def save_chunks_to_file(file_path: str, chunks: Iterable[str], output_dir: str = "output/chunks",
+                        run_id: Optional[str] = None) -> str:
     """
     将chunks保存到单独的文件中
 
+    chunks可以是列表，也可以是生成器等一次性迭代器；
+    每个chunk拼成一段后编码写入大缓冲区，不额外保留整份输出。
+
     Args:
         file_path: 原文件路径
-        chunks: chunks列表
+        chunks: chunks列表或迭代器
         output_dir: 输出目录
+        run_id: 批次标识，同一批次的输出共用；默认使用当前时间
 
     Returns:
         输出文件路径
     """
-    from datetime import datetime
-
     # 创建输出目录
     os.makedirs(output_dir, exist_ok=True)
 
     # 生成输出文件名
     file_name = os.path.basename(file_path)
     base_name = os.path.splitext(file_name)[0]
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = os.path.join(output_dir, f"{base_name}_chunks_{timestamp}.txt")
+    now = datetime.now()
+    run_id = run_id or now.strftime("%Y%m%d_%H%M%S")
+    # 进程号+进程内序号保证并行worker之间、同名文件之间不会互相覆盖
+    output_file = os.path.join(output_dir, f"{base_name}_chunks_{run_id}_{os.getpid()}_{next(_output_counter)}.txt")
+
+    # 迭代器无法预知数量时，总数写在文件末尾
+    total = len(chunks) if isinstance(chunks, Sized) else None
+
+    def emit():
+        """逐段生成编码后的输出内容"""
+        header = (
+            f"文档: {file_name}\n"
+            f"原文件路径: {file_path}\n"
+            f"处理时间: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        )
+        if total is not None:
+            header += f"总chunks数: {total}\n"
+        yield (header + SEPARATOR + "\n\n").encode('utf-8')
+
+        count = 0
+        for count, chunk in enumerate(chunks, 1):
+            yield f"Chunk {count}:\n{SUB_SEPARATOR}\n{chunk}\n\n{SEPARATOR}\n\n".encode('utf-8')
+
+        if total is None:
+            yield f"总chunks数: {count}\n".encode('utf-8')
 
     # 写入chunks
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(f"文档: {file_name}\n")
-        f.write(f"原文件路径: {file_path}\n")
-        f.write(f"处理时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"总chunks数: {len(chunks)}\n")
-        f.write("=" * 80 + "\n\n")
-
-        for i, chunk in enumerate(chunks, 1):
-            f.write(f"Chunk {i}:\n")
-            f.write("-" * 40 + "\n")
-            f.write(chunk)
-            f.write("\n\n" + "=" * 80 + "\n\n")
+    with open(output_file, 'wb', buffering=CHUNK_WRITE_BUFFER_SIZE) as f:
+        f.writelines(emit())
 
     return output_file
 
 
-def process_single_file(file_path: str, config: Dict[str, Any], max_tokens: int = 3000, output_dir: str = "output/chunks") -> Dict[str, Any]:
+def _split_legal(file_path: str, config: Dict[str, Any], max_tokens: int) -> List[str]:
+    """使用法律条款切分器"""
+    logger.debug("⚖️ 使用法律条款切分器处理: %s", file_path)
+    return split_legal_document(file_path, max_tokens=max_tokens, strict_max_tokens=True)
+
+
+def _split_contract(file_path: str, config: Dict[str, Any], max_tokens: int) -> List[str]:
+    """使用合同切分器"""
+    contract_type = config.get("contract_type", "general")
+    logger.debug("📄 使用合同切分器处理 (%s): %s", contract_type, file_path)
+    return split_contract(file_path, contract_type=contract_type, max_tokens=max_tokens, strict_max_tokens=True)
+
+
+def _split_regulation(file_path: str, config: Dict[str, Any], max_tokens: int) -> List[str]:
+    """使用规章制度切分器"""
+    regulation_type = config.get("regulation_type", "general")
+    logger.debug("📋 使用规章制度切分器处理 (%s): %s", regulation_type, file_path)
+    return split_regulation(file_path, regulation_type=regulation_type, max_tokens=max_tokens, strict_max_tokens=True)
+
+
+def _split_general(file_path: str, config: Dict[str, Any], max_tokens: int) -> List[str]:
+    """使用工厂模式自动选择合适的splitter"""
+    logger.debug("📄 使用工厂模式自动选择处理器: %s", file_path)
+    return _FACTORY.split_and_flatten(file_path, max_tokens=max_tokens, strict_max_tokens=True)
+
+
+# helper_type到拆分函数的分派表，未知类型使用工厂模式
+HELPER_DISPATCH = {
+    "legal": _split_legal,
+    "contract": _split_contract,
+    "regulation": _split_regulation,
+}
+
+
+def _split_with_helper(file_path: str, config: Dict[str, Any], max_tokens: int) -> List[str]:
+    """
+    按目录配置选择helper函数拆分文件
+    
+    Args:
+        file_path: 文件路径
+        config: 处理配置
+        max_tokens: 最大token数
+        
+    Returns:
+        chunks列表
+    """
+    split_func = HELPER_DISPATCH.get(config.get("helper_type", "general"), _split_general)
+    return split_func(file_path, config, max_tokens)
+
+
+@lru_cache(maxsize=None)
+def _splitter_fingerprint() -> str:
+    """
+    contract_splitter的版本号加全部源码的摘要，每个进程只计算一次
+    
+    splitter代码改动后缓存键随之变化，不会读到旧代码生成的chunks。
+    """
+    digest = hashlib.sha256(contract_splitter.__version__.encode('utf-8'))
+    package_dir = Path(contract_splitter.__file__).parent
+    for source in sorted(package_dir.rglob("*.py")):
+        digest.update(source.relative_to(package_dir).as_posix().encode('utf-8'))
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def _chunk_cache_key(file_path: str, config: Dict[str, Any], max_tokens: int) -> str:
+    """
+    计算chunk缓存键：文件内容的sha256加上影响拆分结果的配置和splitter代码版本
+    
+    Args:
+        file_path: 文件路径
+        config: 处理配置
+        max_tokens: 最大token数
+        
+    Returns:
+        十六进制摘要
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        # 直接对映射的页面做哈希，不把文件内容复制到Python缓冲区；
+        # 随后splitter读同一文件时命中页缓存
+        if os.fstat(f.fileno()).st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                digest.update(mm)
+    
+    params = json.dumps({
+        "helper_type": config.get("helper_type"),
+        "contract_type": config.get("contract_type"),
+        "regulation_type": config.get("regulation_type"),
+        "max_tokens": max_tokens,
+        "splitter": _splitter_fingerprint()
+    }, sort_keys=True)
+    digest.update(params.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _load_cached_chunks(cache_dir: str, cache_key: str) -> List[str]:
+    """
+    读取磁盘上的chunk缓存
+    
+    缓存不存在时抛出FileNotFoundError。
+    """
+    cache_file = os.path.join(cache_dir, f"{cache_key}.json")
+    with open(cache_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _store_cached_chunks(cache_dir: str, cache_key: str, chunks: List[str]) -> None:
+    """先写临时文件再原子替换，避免并行进程读到写了一半的缓存"""
+    os.makedirs(cache_dir, exist_ok=True)
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=cache_dir,
+                                     suffix='.tmp', delete=False) as tmp:
+        json.dump(chunks, tmp, ensure_ascii=False)
+    os.replace(tmp.name, os.path.join(cache_dir, f"{cache_key}.json"))
+
+
+def _split_cached(file_path: str, config: Dict[str, Any], max_tokens: int, cache_dir: str) -> List[str]:
+    """
+    优先读取磁盘上的chunk缓存，未命中时调用splitter并写入缓存
+    
+    每个文件在一批中只处理一次，不在进程内另外保留chunks，处理完即可释放。
+    """
+    cache_key = _chunk_cache_key(file_path, config, max_tokens)
+    try:
+        chunks = _load_cached_chunks(cache_dir, cache_key)
+        logger.debug("♻️ 命中chunk缓存: %s", file_path)
+        return chunks
+    except FileNotFoundError:
+        pass
+    
+    chunks = _split_with_helper(file_path, config, max_tokens)
+    _store_cached_chunks(cache_dir, cache_key, chunks)
+    return chunks
+
+
+def process_single_file(file_path: str, config: Dict[str, Any], max_tokens: int = 3000, output_dir: str = "output/chunks",
+                        use_cache: bool = True, run_id: Optional[str] = None) -> Dict[str, Any]:
     """
     处理单个文件
     
@@ -109,6 +340,9 @@ def process_single_file(file_path: str, config: Dict[str, Any], max_tokens: int
         file_path: 文件路径
         config: 处理配置
         max_tokens: 最大token数
+        output_dir: chunks输出目录
+        use_cache: 是否使用按文件内容缓存的chunks（缓存位于output_dir下）
+        run_id: 批次标识，用于输出文件名
         
     Returns:
         处理结果
@@ -122,81 +356,71 @@ def process_single_file(file_path: str, config: Dict[str, Any], max_tokens: int
     }
     
     try:
-        # 使用工厂模式检查文件支持
-        factory = get_default_factory()
-        file_info = factory.get_file_info(file_path)
+        # 先用扩展名集合快速拒绝不支持的文件，避免进入splitter
+        file_ext = os.path.splitext(file_path)[1].lower()
+        if file_ext not in SUPPORTED_EXTS:
+            result["error"] = f"不支持的文件格式: {file_ext or '无扩展名'}"
+            return result
+
+        # 使用工厂模式检查文件支持（按扩展名缓存）
+        file_info = _file_info_for_ext(file_ext)
 
         if not file_info['supported']:
             result["error"] = f"不支持的文件格式: {file_info['format']}"
             return result
 
-        print(f"🔄 处理{file_info['format'].upper()}文件: {file_path}")
-        print(f"   使用处理器: {file_info['splitter_class']}")
+        logger.debug("🔄 处理%s文件: %s", file_info['format'].upper(), file_path)
+        logger.debug("   使用处理器: %s", file_info['splitter_class'])
         
-        # 根据配置选择处理方法
-        helper_type = config.get("helper_type", "general")
-        
-        if helper_type == "legal":
-            print(f"⚖️ 使用法律条款切分器处理: {file_path}")
-            chunks = split_legal_document(
-                file_path,
-                max_tokens=max_tokens,
-                strict_max_tokens=True
-            )
-
-        elif helper_type == "contract":
-            contract_type = config.get("contract_type", "general")
-            print(f"📄 使用合同切分器处理 ({contract_type}): {file_path}")
-            chunks = split_contract(
-                file_path,
-                contract_type=contract_type,
-                max_tokens=max_tokens,
-                strict_max_tokens=True
-            )
-
-        elif helper_type == "regulation":
-            regulation_type = config.get("regulation_type", "general")
-            print(f"📋 使用规章制度切分器处理 ({regulation_type}): {file_path}")
-            chunks = split_regulation(
-                file_path,
-                regulation_type=regulation_type,
-                max_tokens=max_tokens,
-                strict_max_tokens=True
-            )
-
+        # 优先使用磁盘上的chunk缓存，未命中时再调用splitter
+        if use_cache:
+            cache_dir = os.path.join(output_dir, CHUNK_CACHE_DIRNAME)
+            chunks = _split_cached(file_path, config, max_tokens, cache_dir)
         else:
-            print(f"📄 使用工厂模式自动选择处理器: {file_path}")
-            # 使用工厂模式自动选择合适的splitter
-            chunks = factory.split_and_flatten(
-                file_path,
-                max_tokens=max_tokens,
-                strict_max_tokens=True
-            )
+            chunks = _split_with_helper(file_path, config, max_tokens)
+        
+        chunks_count = len(chunks)
         
-        # 保存所有chunks到单个文件
+        # 保存所有chunks到单个文件，写完即释放
         if chunks:
-            output_file = save_chunks_to_file(file_path, chunks, output_dir)
+            output_file = save_chunks_to_file(file_path, chunks, output_dir, run_id)
             result["output_files"].append(output_file)
+        del chunks
         
         result["success"] = True
-        result["chunks_count"] = len(chunks)
+        result["chunks_count"] = chunks_count
         
-        print(f"✅ 处理成功: {len(chunks)} 个chunks")
+        logger.debug("✅ 处理成功: %s 个chunks", chunks_count)
         
     except Exception as e:
         result["error"] = str(e)
-        print(f"❌ 处理失败: {e}")
+        logger.debug("❌ 处理失败: %s: %s", file_path, e)
     
     return result
 
 
-def scan_and_process_directory(base_dir: str = "output", max_tokens: int = 3000, output_dir: str = "output/chunks") -> Dict[str, Any]:
+def _dump_result_line(file_result: Dict[str, Any]) -> bytes:
+    """把单个文件的处理结果序列化为一行JSONL"""
+    if orjson is not None:
+        return orjson.dumps(file_result) + b"\n"
+    return json.dumps(file_result, ensure_ascii=False).encode('utf-8') + b"\n"
+
+
+def scan_and_process_directory(base_dir: str = "output", max_tokens: int = 3000, output_dir: str = "output/chunks",
+                               max_workers: Optional[int] = None, use_cache: bool = True,
+                               run_id: Optional[str] = None,
+                               max_file_mb: Optional[float] = None) -> Dict[str, Any]:
     """
     扫描并处理目录下的所有文件
     
     Args:
         base_dir: 基础目录
         max_tokens: 最大token数
+        output_dir: chunks输出目录
+        max_workers: 并行处理的进程数，默认为CPU核数
+        use_cache: 是否使用按文件内容缓存的chunks
+        run_id: 批次标识，默认使用开始处理的时间加随机后缀
+        max_file_mb: 单个文件大小上限（MB），超过则跳过以避免splitter内存溢出；默认None不限制
         
     Returns:
         处理结果汇总
@@ -207,85 +431,164 @@ def scan_and_process_directory(base_dir: str = "output", max_tokens: int = 3000,
         "failed_files": 0,
         "total_chunks": 0,
         "directory_results": {},
-        "errors": []
+        "errors": [],
+        "skipped_files": []
     }
     
-    base_path = Path(base_dir)
-    
-    if not base_path.exists():
-        print(f"❌ 目录不存在: {base_dir}")
+    if not os.path.exists(base_dir):
+        logger.error("❌ 目录不存在: %s", base_dir)
         return results
     
-    # 扫描所有子目录
-    for subdir in base_path.iterdir():
-        if not subdir.is_dir():
-            continue
-        
+    # 时间只精确到秒，加随机后缀避免同一秒启动的两次运行共用分片
+    run_id = run_id or f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+    shard_dir = os.path.join(output_dir, RESULTS_SHARD_DIRNAME, run_id)
+    
+    # 扫描所有子目录，收集待处理的文件（DirEntry自带类型信息，避免额外stat）
+    output_root = Path(output_dir).resolve()
+    with os.scandir(base_dir) as it:
+        subdirs = [
+            entry for entry in it
+            if entry.is_dir(follow_symlinks=False)
+            and entry.name not in SKIPPED_SUBDIRS
+            and Path(entry.path).resolve() != output_root
+        ]
+    max_bytes = max_file_mb * 1024 * 1024 if max_file_mb is not None else None
+    
+    jobs = []
+    for subdir in subdirs:
         subdir_name = subdir.name
         config = get_directory_helper_config(subdir_name)
         
-        print(f"\n📁 处理目录: {subdir_name} ({config['description']})")
-        print("=" * 80)
+        logger.info("📁 扫描目录: %s (%s)", subdir_name, config['description'])
         
-        dir_results = {
+        results["directory_results"][subdir_name] = {
             "config": config,
-            "files": [],
+            "files_shard": os.path.join(shard_dir, f"{subdir_name}.jsonl"),
             "total_files": 0,
             "successful_files": 0,
             "total_chunks": 0
         }
         
-        # 处理目录中的所有文件
-        for file_path in subdir.iterdir():
-            if file_path.is_file():
-                file_ext = file_path.suffix.lower()
-                
-                # 支持的文件格式
-                if file_ext in ['.docx', '.doc', '.wps', '.pdf']:
-                    print(f"\n📄 处理文件: {file_path.name}")
-                    
-                    file_result = process_single_file(str(file_path), config, max_tokens, output_dir)
-                    dir_results["files"].append(file_result)
+        with os.scandir(subdir.path) as it:
+            for entry in it:
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTS:
+                    size = entry.stat().st_size
+                    if max_bytes is not None and size > max_bytes:
+                        logger.warning("⏭️ 跳过过大文件: %s/%s (%.1f MB)", subdir_name, entry.name, size / 1024 / 1024)
+                        results["skipped_files"].append({"file": entry.path, "reason": "skipped_too_large", "size": size})
+                        continue
+                    jobs.append((entry.path, entry.name, size, subdir_name, config))
+    
+    # 大文件优先提交，避免最后只剩一个worker处理最大的文件
+    jobs.sort(key=lambda job: job[2], reverse=True)
+    
+    logger.info("🔄 共 %s 个文件，使用 %s 个进程并行处理", len(jobs), max_workers or os.cpu_count())
+    logger.info(SEPARATOR)
+    
+    os.makedirs(shard_dir, exist_ok=True)
+    try:
+        # 每个文件相互独立，交给进程池并行处理；结果逐条写入各目录的分片
+        with ExitStack() as stack:
+            # 分片以独占模式创建，重复的run_id直接报错而不是截断其他运行的分片
+            shards = {
+                subdir_name: stack.enter_context(open(dir_results["files_shard"], 'xb'))
+                for subdir_name, dir_results in results["directory_results"].items()
+            }
+            executor = stack.enter_context(
+                ProcessPoolExecutor(max_workers=max_workers, initializer=_configure_logging,
+                                    initargs=(logger.getEffectiveLevel(),))
+            )
+            futures = {
+                executor.submit(process_single_file, file_path, config, max_tokens, output_dir, use_cache, run_id): (file_path, file_name, subdir_name)
+                for file_path, file_name, _, subdir_name, config in jobs
+            }
+        
+            for future in as_completed(futures):
+                file_path, file_name, subdir_name = futures[future]
+            
+                try:
+                    file_result = future.result()
+                except Exception as e:
+                    # 子进程异常退出等情况
+                    file_result = {
+                        "file_path": file_path,
+                        "success": False,
+                        "chunks_count": 0,
+                        "error": str(e),
+                        "output_files": []
+                    }
+            
+                shards[subdir_name].write(_dump_result_line(file_result))
+            
+                if file_result["success"]:
+                    logger.info("✅ %s/%s: %s 个chunks", subdir_name, file_name, file_result['chunks_count'])
+                else:
+                    logger.warning("❌ %s/%s: %s", subdir_name, file_name, file_result['error'])
+    
+        # 所有文件完成后逐行读取各目录分片汇总，内存占用与文件数无关
+        for subdir_name, dir_results in results["directory_results"].items():
+            with open(dir_results["files_shard"], 'rb') as shard:
+                for line in shard:
+                    r = json.loads(line)
                     dir_results["total_files"] += 1
-                    results["total_files"] += 1
-                    
-                    if file_result["success"]:
+                    if r["success"]:
                         dir_results["successful_files"] += 1
-                        dir_results["total_chunks"] += file_result["chunks_count"]
-                        results["successful_files"] += 1
-                        results["total_chunks"] += file_result["chunks_count"]
+                        dir_results["total_chunks"] += r["chunks_count"]
                     else:
-                        results["failed_files"] += 1
-                        results["errors"].append({
-                            "file": str(file_path),
-                            "error": file_result["error"]
-                        })
+                        results["errors"].append({"file": r["file_path"], "error": r["error"]})
         
-        results["directory_results"][subdir_name] = dir_results
+            results["total_files"] += dir_results["total_files"]
+            results["successful_files"] += dir_results["successful_files"]
+            results["failed_files"] += dir_results["total_files"] - dir_results["successful_files"]
+            results["total_chunks"] += dir_results["total_chunks"]
         
-        print(f"\n📊 {subdir_name} 目录处理完成:")
-        print(f"  总文件数: {dir_results['total_files']}")
-        print(f"  成功处理: {dir_results['successful_files']}")
-        print(f"  生成chunks: {dir_results['total_chunks']}")
+            logger.info("📊 %s 目录处理完成:", subdir_name)
+            logger.info("  总文件数: %s", dir_results['total_files'])
+            logger.info("  成功处理: %s", dir_results['successful_files'])
+            logger.info("  生成chunks: %s", dir_results['total_chunks'])
+            # 分片随后删除，不在结果中保留指向它的路径
+            dir_results.pop("files_shard")
+    
+    finally:
+        # 分片只是本次运行的中间结果，汇总后删除；父目录为空时一并删除
+        shutil.rmtree(shard_dir, ignore_errors=True)
+        with suppress(OSError):
+            os.rmdir(os.path.dirname(shard_dir))
     
     return results
 
 
 def main():
     """主函数"""
+    parser = argparse.ArgumentParser(description="批量处理output目录下的分类文件")
+    parser.add_argument("--workers", type=int, default=None, help="并行处理的进程数（默认: CPU核数）")
+    parser.add_argument("--max-file-mb", type=float, default=None,
+                        help="跳过超过该大小（MB）的文件（默认: 不限制）")
+    parser.add_argument("--no-cache", action="store_true", help="忽略chunk缓存，重新拆分所有文件")
+    parser.add_argument("-q", "--quiet", action="store_true", help="只输出警告、错误和最终汇总")
+    parser.add_argument("-v", "--verbose", action="store_true", help="输出每个文件的处理细节")
+    args = parser.parse_args()
+
+    if args.quiet:
+        _configure_logging(logging.WARNING)
+    elif args.verbose:
+        _configure_logging(logging.DEBUG)
+    else:
+        _configure_logging(logging.INFO)
+
     print("🚀 批量文档处理测试")
-    print("=" * 80)
+    print(SEPARATOR)
     print("📋 配置:")
     print(f"  最大token数: 3000")
     print(f"  严格chunk控制: 启用")
+    print(f"  并行进程数: {args.workers or os.cpu_count()}")
 
     # 显示工厂模式支持的格式
-    factory = get_default_factory()
-    supported_formats = factory.get_supported_formats()
+    supported_formats = _FACTORY.get_supported_formats()
     print(f"  支持格式: {', '.join(supported_formats).upper()}")
 
     # 显示格式能力
-    capabilities = factory.get_format_capabilities()
+    capabilities = _FACTORY.get_format_capabilities()
     print("  处理器映射:")
     for format_type, info in capabilities.items():
         print(f"    {format_type.upper()}: {info['splitter_class']}")
@@ -293,12 +596,14 @@ def main():
     # 开始处理
     output_chunks_dir = "output/chunks"
     print(f"  输出目录: {output_chunks_dir}")
-    results = scan_and_process_directory("output", max_tokens=3000, output_dir=output_chunks_dir)
+    results = scan_and_process_directory("output", max_tokens=3000, output_dir=output_chunks_dir,
+                                         max_workers=args.workers, use_cache=not args.no_cache,
+                                         max_file_mb=args.max_file_mb)
     
     # 输出汇总结果
-    print("\n" + "=" * 80)
+    print("\n" + SEPARATOR)
     print("📊 处理结果汇总")
-    print("=" * 80)
+    print(SEPARATOR)
     print(f"总文件数: {results['total_files']}")
     print(f"成功处理: {results['successful_files']}")
     print(f"处理失败: {results['failed_files']}")
@@ -311,6 +616,12 @@ def main():
         print(f"  成功: {dir_result['successful_files']}")
         print(f"  Chunks: {dir_result['total_chunks']}")
     
+    # 显示跳过的文件
+    if results["skipped_files"]:
+        print(f"\n⏭️ 跳过的过大文件:")
+        for skipped in results["skipped_files"]:
+            print(f"  {skipped['file']}: {skipped['size'] / 1024 / 1024:.1f} MB")
+    
     # 显示错误
     if results["errors"]:
         print(f"\n❌ 处理失败的文件:")
@@ -319,8 +630,11 @@ def main():
     
     # 保存详细结果到JSON文件
     output_file = "output/batch_processing_results.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        Path(output_file).write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
     
     print(f"\n💾 详细结果已保存到: {output_file}")
 
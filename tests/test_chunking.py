@@ -5,10 +5,19 @@
  
 import sys
 import os
+import io
+import re
 import json
-import glob
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    import orjson  # 可选：更快的JSON序列化
+except ImportError:
+    orjson = None
  
 # 添加父目录到路径
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -16,67 +25,151 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from contract_splitter import ContractSplitter, split_document, flatten_sections
 from contract_splitter.domain_helpers import split_legal_document, split_contract, split_regulation
 from contract_splitter.utils import (
-    count_tokens, split_chinese_sentences, sliding_window_split, clean_text
+    count_tokens, split_chinese_sentences, sliding_window_split, clean_text,
+    _get_tiktoken_encoding,
 )
  
  
-def find_document_files() -> List[str]:
-    """查找output目录下的所有支持格式的文档"""
-    supported_extensions = ['*.doc', '*.docx', '*.pdf', '*.wps', '*.xlsx', '*.xls', '*.xlsm']
-    document_files = []
+# chunks文本文件中的分隔行
+SEPARATOR = "=" * 80
+SUB_SEPARATOR = "-" * 40
 
-    for ext in supported_extensions:
-        files = glob.glob(f"output/{ext}")
-        document_files.extend(files)
-        # 也搜索子目录
-        files = glob.glob(f"output/*/{ext}")
-        document_files.extend(files)
+# CJK统一汉字，用于判断chunk是否包含中文
+_CJK_RE = re.compile(r'[\u4e00-\u9fff]')
 
-    return sorted(document_files)
+def _save_json(data: Any, output_file) -> None:
+    """以UTF-8、2空格缩进保存JSON，有orjson时优先使用"""
+    if orjson is not None:
+        Path(output_file).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
 
 
-def find_wps_files() -> List[str]:
-    """专门查找WPS文件"""
-    wps_files = []
+# 法律文档判断：路径中的law目录，或文件名中的法律相关关键词
+_LEGAL_PATH_RE = re.compile(r'[\\/]law[\\/]', re.IGNORECASE)
+_LEGAL_NAME_RE = re.compile(r'law|法律|法规|条例|办法|规定|管理|监督|证券|银行|金融', re.IGNORECASE)
 
-    # 搜索output目录及其子目录下的WPS文件
-    wps_files.extend(glob.glob("output/*.wps"))
-    wps_files.extend(glob.glob("output/*/*.wps"))
-    wps_files.extend(glob.glob("output/*/*/*.wps"))
+SUPPORTED_EXTENSIONS = frozenset({'.doc', '.docx', '.pdf', '.wps', '.xlsx', '.xls', '.xlsm'})
 
-    return sorted(wps_files)
 
+def _walk_files(root: str, extensions: frozenset, max_depth: int) -> List[str]:
+    """
+    一次遍历root目录，收集扩展名匹配的文件
 
-def is_legal_document(file_path: str) -> bool:
-    """检测是否为法律文档"""
-    file_path_lower = file_path.lower()
+    Args:
+        root: 起始目录
+        extensions: 小写扩展名集合
+        max_depth: 最大子目录深度，0表示只看root本身
 
-    # 检查路径中是否包含法律相关关键词
-    legal_keywords = ['law', '法律', '法规', '条例', '办法', '规定', '管理', '监督', '证券', '银行', '金融']
+    Returns:
+        排序后的文件路径列表
+    """
+    found = []
+    root_depth = root.rstrip(os.sep).count(os.sep)
 
-    # 检查文件路径
-    if '/law/' in file_path_lower or '\\law\\' in file_path_lower:
-        return True
+    for dir_path, dir_names, file_names in os.walk(root):
+        if dir_path.count(os.sep) - root_depth >= max_depth:
+            dir_names.clear()  # 不再深入
+        else:
+            # 与glob一致，跳过隐藏目录
+            dir_names[:] = [d for d in dir_names if not d.startswith('.')]
+        found.extend(
+            os.path.join(dir_path, name) for name in file_names
+            if not name.startswith('.') and os.path.splitext(name)[1].lower() in extensions
+        )
 
-    # 检查文件名
-    file_name = Path(file_path).stem.lower()
-    for keyword in legal_keywords:
-        if keyword in file_name:
-            return True
+    return sorted(found)
+
+
+def find_document_files() -> List[str]:
+    """查找output目录及其一级子目录下的所有支持格式的文档"""
+    return _walk_files("output", SUPPORTED_EXTENSIONS, max_depth=1)
+
+
+def find_wps_files() -> List[str]:
+    """专门查找WPS文件（output目录下最多两级子目录）"""
+    return _walk_files("output", frozenset({'.wps'}), max_depth=2)
 
-    return False
+
+@lru_cache(maxsize=1024)
+def is_legal_document(file_path: str) -> bool:
+    """检测是否为法律文档（只依赖路径字符串，结果可缓存）"""
+    # 检查文件路径中的law目录，再检查文件名中的法律相关关键词
+    return bool(_LEGAL_PATH_RE.search(file_path) or _LEGAL_NAME_RE.search(Path(file_path).stem))
+
+
+@lru_cache(maxsize=None)
+def _get_contract_splitter() -> ContractSplitter:
+    """
+    每个进程共用一个ContractSplitter
+
+    各策略只通过reconfigure调整max_tokens/overlap，
+    已初始化的格式splitter和结构检测器不再重复创建。
+    """
+    return ContractSplitter(
+        max_tokens=2000,
+        overlap=200,
+        split_by_sentence=True,
+        token_counter="character"
+    )
+
+
+@lru_cache(maxsize=32)
+def _split_with_strategy(abs_path: str, mtime_ns: int, max_tokens: int, overlap: int,
+                         legal: bool) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    按策略参数切分文档，返回(sections, chunks)
+
+    结果按(路径, mtime, 参数)缓存，同一进程内测试和保存chunks共用一次解析。
+    PDF等格式的sections本身依赖max_tokens，所以不同策略仍各自解析。
+    """
+    if legal:
+        chunks = split_legal_document(abs_path, max_tokens=max_tokens)
+        # 模拟sections结构以保持兼容性
+        sections = [{"heading": f"法律条文 {i+1}", "content": chunk, "subsections": []}
+                    for i, chunk in enumerate(chunks)]
+        return sections, chunks
+
+    # 使用ContractSplitter进行层次化分割，只调整切分参数
+    splitter = _get_contract_splitter()
+    splitter.reconfigure(max_tokens=max_tokens, overlap=overlap)
+    # 获取层次化结构
+    sections = splitter.split(abs_path)
+    # 展平为chunks
+    return sections, splitter.flatten(sections)
+
+
+def split_with_strategy(file_path: str, max_tokens: int, overlap: int) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """获取文件在指定策略下的sections和完整chunks（带缓存，调用方不要修改返回值）"""
+    return _split_with_strategy(os.path.abspath(file_path), os.stat(file_path).st_mtime_ns,
+                                max_tokens, overlap, is_legal_document(file_path))
+
+
+
+def get_document_chunks(file_path: str) -> List[str]:
+    """
+    ContractSplitter默认参数下的完整chunks（带缓存）
+
+    token计数和中文处理测试共用这一次解析；非法律文档与large_chunks策略参数相同，
+    直接命中test_file_chunking的缓存。
+    """
+    _, chunks = _split_with_strategy(os.path.abspath(file_path), os.stat(file_path).st_mtime_ns,
+                                     2000, 200, False)
+    return chunks
  
  
 def test_file_chunking(file_path: str) -> Dict[str, Any]:
     """对单个文件进行chunking测试"""
+    path = Path(file_path)
     print(f"\n{'='*60}")
     print(f"测试文件: {file_path}")
     print(f"{'='*60}")
     
     result = {
         "file_path": file_path,
-        "file_size": os.path.getsize(file_path),
-        "file_extension": Path(file_path).suffix.lower(),
+        "file_size": path.stat().st_size,
+        "file_extension": path.suffix.lower(),
         "test_results": {}
     }
     
@@ -106,30 +199,11 @@ def test_file_chunking(file_path: str) -> Dict[str, Any]:
                 # 智能选择处理方法
                 if is_legal_document(file_path):
                     print(f"  📚 检测到法律文档，使用专用切分器")
-                    # 使用法律文档专用切分器
-                    chunks = split_legal_document(
-                        file_path,
-                        max_tokens=strategy["max_tokens"]
-                    )
-
-                    # 模拟sections结构以保持兼容性
-                    sections = [{"heading": f"法律条文 {i+1}", "content": chunk, "subsections": []}
-                              for i, chunk in enumerate(chunks)]
-                    flattened_chunks = chunks
                 else:
                     print(f"  📄 使用通用切分器")
-                    # 使用ContractSplitter进行层次化分割
-                    splitter = ContractSplitter(
-                        max_tokens=strategy["max_tokens"],
-                        overlap=strategy["overlap"],
-                        split_by_sentence=True,
-                        token_counter="character"
-                    )
-
-                    # 获取层次化结构
-                    sections = splitter.split(file_path)
-                    # 展平为chunks
-                    flattened_chunks = splitter.flatten(sections)
+                sections, flattened_chunks = split_with_strategy(
+                    file_path, strategy["max_tokens"], strategy["overlap"]
+                )
 
                 strategy_result["hierarchical_sections"] = {
                     "num_sections": len(sections),
@@ -168,15 +242,17 @@ def test_file_chunking(file_path: str) -> Dict[str, Any]:
                 
                 # 分析chunks质量
                 if flattened_chunks:
-                    avg_chunk_length = sum(len(chunk) for chunk in flattened_chunks) / len(flattened_chunks)
-                    max_chunk_length = max(len(chunk) for chunk in flattened_chunks)
-                    min_chunk_length = min(len(chunk) for chunk in flattened_chunks)
+                    # 长度只计算一次，后续统计都在整数列表上进行
+                    lengths = [len(chunk) for chunk in flattened_chunks]
+                    avg_chunk_length = sum(lengths) / len(lengths)
+                    max_chunk_length = max(lengths)
+                    min_chunk_length = min(lengths)
                     
                     strategy_result["chunk_analysis"] = {
                         "avg_chunk_length": round(avg_chunk_length, 2),
                         "max_chunk_length": max_chunk_length,
                         "min_chunk_length": min_chunk_length,
-                        "chunks_within_limit": sum(1 for chunk in flattened_chunks if len(chunk) <= strategy["max_tokens"])
+                        "chunks_within_limit": sum(1 for length in lengths if length <= strategy["max_tokens"])
                     }
                     
                     print(f"  平均chunk长度: {avg_chunk_length:.0f} 字符")
@@ -201,8 +277,25 @@ def test_file_chunking(file_path: str) -> Dict[str, Any]:
     return result
  
  
-def test_token_counting_comparison(file_path: str) -> Dict[str, Any]:
-    """测试不同token计数方法的对比"""
+def count_tokens_batch(texts: List[str], method: str = "character") -> List[int]:
+    """
+    批量计算token数
+
+    tiktoken一次encode_batch处理所有文本，避免逐条调用的开销；
+    其他方法与count_tokens逐条计数一致。
+    """
+    if method == "tiktoken":
+        try:
+            encoding = _get_tiktoken_encoding()  # 与count_tokens共用同一个编码器
+        except ImportError:
+            # 与count_tokens一致，回退到字符计数
+            return [len(text) for text in texts]
+        return [len(tokens) for tokens in encoding.encode_batch(texts)]
+    return [count_tokens(text, method) for text in texts]
+ 
+ 
+def test_token_counting_comparison(file_path: str, flattened: Optional[List[str]] = None) -> Dict[str, Any]:
+    """测试不同token计数方法的对比（flattened为已切分好的chunks，未提供时自行获取）"""
     print(f"\n{'='*60}")
     print(f"Token计数方法对比: {file_path}")
     print(f"{'='*60}")
@@ -214,9 +307,8 @@ def test_token_counting_comparison(file_path: str) -> Dict[str, Any]:
     
     try:
         # 获取文档内容
-        splitter = ContractSplitter()
-        sections = splitter.split(file_path)
-        flattened = splitter.flatten(sections)
+        if flattened is None:
+            flattened = get_document_chunks(file_path)
         full_text = " ".join(flattened)
         
         # 测试不同的token计数方法
@@ -255,7 +347,7 @@ def test_token_counting_comparison(file_path: str) -> Dict[str, Any]:
                 method_result["chunk_tests"][f"size_{chunk_size}"] = {
                     "max_tokens": chunk_size,
                     "num_chunks": len(chunks),
-                    "avg_tokens_per_chunk": round(sum(count_tokens(chunk, method) for chunk in chunks) / len(chunks), 2) if chunks else 0
+                    "avg_tokens_per_chunk": round(sum(count_tokens_batch(chunks, method)) / len(chunks), 2) if chunks else 0
                 }
                 
                 print(f"  Chunk大小 {chunk_size}: {len(chunks)} 个chunks")
@@ -269,8 +361,8 @@ def test_token_counting_comparison(file_path: str) -> Dict[str, Any]:
     return result
 
 
-def test_chinese_text_processing(file_path: str) -> Dict[str, Any]:
-    """测试中文文本处理能力"""
+def test_chinese_text_processing(file_path: str, flattened: Optional[List[str]] = None) -> Dict[str, Any]:
+    """测试中文文本处理能力（flattened为已切分好的chunks，未提供时自行获取）"""
     print(f"\n{'='*60}")
     print(f"中文文本处理测试: {file_path}")
     print(f"{'='*60}")
@@ -282,16 +374,11 @@ def test_chinese_text_processing(file_path: str) -> Dict[str, Any]:
 
     try:
         # 获取文档内容
-        splitter = ContractSplitter()
-        sections = splitter.split(file_path)
-        flattened = splitter.flatten(sections)
+        if flattened is None:
+            flattened = get_document_chunks(file_path)
 
         # 选择一个包含中文的chunk进行测试
-        chinese_chunk = None
-        for chunk in flattened:
-            if any('\u4e00' <= char <= '\u9fff' for char in chunk):
-                chinese_chunk = chunk
-                break
+        chinese_chunk = next((chunk for chunk in flattened if _CJK_RE.search(chunk)), None)
 
         if chinese_chunk:
             print(f"✓ 找到中文内容，长度: {len(chinese_chunk)} 字符")
@@ -325,17 +412,70 @@ def test_chinese_text_processing(file_path: str) -> Dict[str, Any]:
     return result
 
 
+@lru_cache(maxsize=1024)
+def safe_chunk_dir_name(file_path: str) -> str:
+    """文件对应的单独chunks目录名：文件名中只保留字母数字、空格、-和_"""
+    return "".join(c for c in Path(file_path).stem if c.isalnum() or c in (' ', '-', '_')).rstrip()
+
+
+def _write_strategy_chunks(file_path: str, file_output_dir: Path, strategy_name: str,
+                           strategy_result: Dict[str, Any], full_chunks: List[str]) -> List[str]:
+    """把单个策略的完整chunks写成TXT和JSON两个文件，返回文件路径"""
+    # 保存chunks到文本文件（方便阅读）
+    chunks_txt_file = file_output_dir / f"{strategy_name}_chunks.txt"
+    with open(chunks_txt_file, 'w', encoding='utf-8') as f:
+        f.write(
+            f"文件: {file_path}\n"
+            f"策略: {strategy_name}\n"
+            f"参数: max_tokens={strategy_result['max_tokens']}, overlap={strategy_result['overlap']}\n"
+            f"总chunks数: {len(full_chunks)}\n"
+            f"{SEPARATOR}\n\n"
+        )
+        # 每个chunk拼成一段写入
+        f.writelines(
+            f"【Chunk {i+1:03d}】 (长度: {len(chunk)} 字符)\n{SUB_SEPARATOR}\n{chunk}\n{SEPARATOR}\n\n"
+            for i, chunk in enumerate(full_chunks)
+        )
+
+    # 保存chunks到JSON文件（方便程序处理）
+    lengths = [len(chunk) for chunk in full_chunks]
+    chunks_json_file = file_output_dir / f"{strategy_name}_chunks.json"
+    chunks_data = {
+        "file_path": file_path,
+        "strategy": strategy_name,
+        "parameters": {
+            "max_tokens": strategy_result["max_tokens"],
+            "overlap": strategy_result["overlap"]
+        },
+        "statistics": {
+            "total_chunks": len(full_chunks),
+            "avg_length": round(sum(lengths) / len(lengths), 2) if lengths else 0,
+            "max_length": max(lengths) if lengths else 0,
+            "min_length": min(lengths) if lengths else 0
+        },
+        "chunks": [
+            {
+                "id": i + 1,
+                "content": chunk,
+                "length": length
+            }
+            for i, (chunk, length) in enumerate(zip(full_chunks, lengths))
+        ]
+    }
+
+    _save_json(chunks_data, chunks_json_file)
+
+    return [str(chunks_txt_file), str(chunks_json_file)]
+
+
 def save_individual_chunks(file_path: str, test_results: Dict[str, Any], output_dir: str = "output"):
     """为单个文件保存chunks到独立文件，方便人工核对"""
-    file_name = Path(file_path).stem
-    safe_name = "".join(c for c in file_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-
     # 创建文件专用目录
-    file_output_dir = Path(output_dir) / "individual_chunks" / safe_name
+    file_output_dir = Path(output_dir) / "individual_chunks" / safe_chunk_dir_name(file_path)
     file_output_dir.mkdir(parents=True, exist_ok=True)
 
-    saved_files = []
-
+    # 先取得各策略的完整chunks（preview只有前3个），测试阶段已解析过则直接复用
+    tasks = []
     for strategy_name, strategy_result in test_results.items():
         if "error" in strategy_result:
             continue
@@ -344,73 +484,32 @@ def save_individual_chunks(file_path: str, test_results: Dict[str, Any], output_
         if not flattened_chunks or "chunks_preview" not in flattened_chunks:
             continue
 
-        # 重新获取完整的chunks（preview只有前3个）
         try:
-            # 根据文档类型选择处理方法
-            if is_legal_document(file_path):
-                # 使用法律文档专用切分器
-                full_chunks = split_legal_document(
-                    file_path,
-                    max_tokens=strategy_result["max_tokens"]
-                )
-            else:
-                # 重新处理以获取完整chunks
-                splitter = ContractSplitter(
-                    max_tokens=strategy_result["max_tokens"],
-                    overlap=strategy_result["overlap"],
-                    split_by_sentence=True,
-                    token_counter="character"
-                )
-                sections = splitter.split(file_path)
-                full_chunks = splitter.flatten(sections)
-
-            # 保存chunks到文本文件（方便阅读）
-            chunks_txt_file = file_output_dir / f"{strategy_name}_chunks.txt"
-            with open(chunks_txt_file, 'w', encoding='utf-8') as f:
-                f.write(f"文件: {file_path}\n")
-                f.write(f"策略: {strategy_name}\n")
-                f.write(f"参数: max_tokens={strategy_result['max_tokens']}, overlap={strategy_result['overlap']}\n")
-                f.write(f"总chunks数: {len(full_chunks)}\n")
-                f.write("=" * 80 + "\n\n")
-
-                for i, chunk in enumerate(full_chunks):
-                    f.write(f"【Chunk {i+1:03d}】 (长度: {len(chunk)} 字符)\n")
-                    f.write("-" * 40 + "\n")
-                    f.write(chunk)
-                    f.write("\n" + "=" * 80 + "\n\n")
-
-            # 保存chunks到JSON文件（方便程序处理）
-            chunks_json_file = file_output_dir / f"{strategy_name}_chunks.json"
-            chunks_data = {
-                "file_path": file_path,
-                "strategy": strategy_name,
-                "parameters": {
-                    "max_tokens": strategy_result["max_tokens"],
-                    "overlap": strategy_result["overlap"]
-                },
-                "statistics": {
-                    "total_chunks": len(full_chunks),
-                    "avg_length": round(sum(len(chunk) for chunk in full_chunks) / len(full_chunks), 2) if full_chunks else 0,
-                    "max_length": max(len(chunk) for chunk in full_chunks) if full_chunks else 0,
-                    "min_length": min(len(chunk) for chunk in full_chunks) if full_chunks else 0
-                },
-                "chunks": [
-                    {
-                        "id": i + 1,
-                        "content": chunk,
-                        "length": len(chunk)
-                    }
-                    for i, chunk in enumerate(full_chunks)
-                ]
-            }
+            _, full_chunks = split_with_strategy(
+                file_path, strategy_result["max_tokens"], strategy_result["overlap"]
+            )
+        except Exception as e:
+            print(f"  ⚠️ 无法重新处理 {strategy_name}: {e}")
+            continue
 
-            with open(chunks_json_file, 'w', encoding='utf-8') as f:
-                json.dump(chunks_data, f, ensure_ascii=False, indent=2)
+        tasks.append((strategy_name, strategy_result, full_chunks))
 
-            saved_files.extend([str(chunks_txt_file), str(chunks_json_file)])
+    if not tasks:
+        return []
 
-        except Exception as e:
-            print(f"  ⚠️ 无法重新处理 {strategy_name}: {e}")
+    # 写文件是I/O密集型，各策略的文件用线程并发写入
+    saved_files = []
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = [
+            (strategy_name, executor.submit(_write_strategy_chunks, file_path, file_output_dir,
+                                            strategy_name, strategy_result, full_chunks))
+            for strategy_name, strategy_result, full_chunks in tasks
+        ]
+        for strategy_name, future in futures:
+            try:
+                saved_files.extend(future.result())
+            except Exception as e:
+                print(f"  ⚠️ 无法保存 {strategy_name}: {e}")
 
     return saved_files
 
@@ -430,8 +529,7 @@ def save_test_results(all_results: List[Dict[str, Any]], output_dir: str = "outp
 
     # 保存详细结果
     detailed_file = f"{output_dir}/chunking_test_detailed_{timestamp}.json"
-    with open(detailed_file, 'w', encoding='utf-8') as f:
-        json.dump(all_results, f, ensure_ascii=False, indent=2)
+    _save_json(all_results, detailed_file)
     print(f"✓ 详细结果已保存: {detailed_file}")
 
     # 生成汇总报告
@@ -439,24 +537,17 @@ def save_test_results(all_results: List[Dict[str, Any]], output_dir: str = "outp
     generate_summary_report(all_results, summary_file)
     print(f"✓ 汇总报告已保存: {summary_file}")
 
-    # 为每个文件单独保存chunks
-    print(f"\n保存单独的chunks文件...")
-    all_saved_files = []
+    # 单独的chunks文件已在各文件的测试进程中保存
+    print(f"\n单独的chunks文件...")
+    total_saved = 0
 
     for result in all_results:
-        if "error" in result:
-            continue
-
-        file_path = result["file_path"]
-        test_results = result.get("test_results", {})
+        saved_files = result.get("individual_chunk_files")
+        if saved_files is not None:
+            print(f"  📁 {Path(result['file_path']).name}: 保存了 {len(saved_files)} 个文件")
+            total_saved += len(saved_files)
 
-        if test_results:
-            print(f"  📁 保存 {Path(file_path).name} 的chunks...")
-            saved_files = save_individual_chunks(file_path, test_results, output_dir)
-            all_saved_files.extend(saved_files)
-            print(f"    ✓ 保存了 {len(saved_files)} 个文件")
-
-    print(f"✓ 总共保存了 {len(all_saved_files)} 个单独的chunks文件")
+    print(f"✓ 总共保存了 {total_saved} 个单独的chunks文件")
 
     return detailed_file, summary_file
 
@@ -467,25 +558,26 @@ def generate_summary_report(all_results: List[Dict[str, Any]], output_file: str)
         f.write("# Chunking测试汇总报告\n\n")
         f.write(f"生成时间: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
 
+        # 一次遍历同时得到总体统计和按文件类型统计
+        total_files = len(all_results)
+        successful_files = 0
+        file_types = {}
+        for result in all_results:
+            ext = result.get("file_extension", "unknown")
+            stats = file_types.setdefault(ext, {"total": 0, "success": 0})
+            stats["total"] += 1
+            if "error" not in result:
+                stats["success"] += 1
+                successful_files += 1
+
         # 总体统计
         f.write("## 总体统计\n\n")
-        total_files = len(all_results)
-        successful_files = sum(1 for r in all_results if "error" not in r)
         f.write(f"- 测试文件总数: {total_files}\n")
         f.write(f"- 成功处理文件: {successful_files}\n")
         f.write(f"- 失败文件: {total_files - successful_files}\n\n")
 
         # 按文件类型统计
         f.write("## 按文件类型统计\n\n")
-        file_types = {}
-        for result in all_results:
-            ext = result.get("file_extension", "unknown")
-            if ext not in file_types:
-                file_types[ext] = {"total": 0, "success": 0}
-            file_types[ext]["total"] += 1
-            if "error" not in result:
-                file_types[ext]["success"] += 1
-
         for ext, stats in file_types.items():
             f.write(f"- {ext}: {stats['success']}/{stats['total']} 成功\n")
         f.write("\n")
@@ -494,7 +586,7 @@ def generate_summary_report(all_results: List[Dict[str, Any]], output_file: str)
         f.write("## 详细结果\n\n")
         for i, result in enumerate(all_results):
             file_name = Path(result['file_path']).name
-            safe_name = "".join(c for c in Path(result['file_path']).stem if c.isalnum() or c in (' ', '-', '_')).rstrip()
+            safe_name = safe_chunk_dir_name(result['file_path'])
 
             f.write(f"### {i+1}. {file_name}\n\n")
             f.write(f"- 文件路径: `{result['file_path']}`\n")
@@ -569,6 +661,48 @@ def generate_summary_report(all_results: List[Dict[str, Any]], output_file: str)
         f.write("4. 验证关键信息是否完整保留\n")
 
 
+def _process_one_file(file_path: str, output_dir: str = "output") -> Tuple[Dict[str, Any], str]:
+    """
+    在工作进程中完成单个文件的全部测试，并保存该文件的单独chunks
+
+    在同一进程内保存chunks可以直接命中split_with_strategy的缓存。
+    打印输出收集到缓冲区，由主进程按文件整段输出，避免多进程输出交错。
+
+    Returns:
+        (合并后的测试结果, 该文件的打印输出)
+    """
+    log = io.StringIO()
+    with redirect_stdout(log):
+        # 基本chunking测试
+        chunking_result = test_file_chunking(file_path)
+
+        # 后两项测试共用同一份chunks；获取失败时由各测试自行报告错误
+        try:
+            flattened = get_document_chunks(file_path)
+        except Exception:
+            flattened = None
+
+        # Token计数对比测试
+        token_result = test_token_counting_comparison(file_path, flattened)
+
+        # 中文处理测试
+        chinese_result = test_chinese_text_processing(file_path, flattened)
+
+        # 合并结果
+        combined_result = {
+            **chunking_result,
+            **token_result,
+            **chinese_result
+        }
+
+        # 为该文件单独保存chunks
+        test_results = combined_result.get("test_results", {})
+        if "error" not in combined_result and test_results:
+            combined_result["individual_chunk_files"] = save_individual_chunks(file_path, test_results, output_dir)
+
+    return combined_result, log.getvalue()
+
+
 def run_comprehensive_tests():
     """运行综合测试"""
     print("🚀 开始综合Chunking测试")
@@ -586,29 +720,34 @@ def run_comprehensive_tests():
     for file in document_files:
         print(f"  - {file}")
 
-    all_results = []
-
-    # 对每个文件进行测试
-    for i, file_path in enumerate(document_files):
-        print(f"\n🔄 处理文件 {i+1}/{len(document_files)}: {Path(file_path).name}")
-
-        # 基本chunking测试
-        chunking_result = test_file_chunking(file_path)
+    all_results = [None] * len(document_files)
 
-        # Token计数对比测试
-        token_result = test_token_counting_comparison(file_path)
+    # 各文件相互独立，交给进程池并行测试
+    max_workers = min(len(document_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_process_one_file, file_path): i
+            for i, file_path in enumerate(document_files)
+        }
 
-        # 中文处理测试
-        chinese_result = test_chinese_text_processing(file_path)
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            file_path = document_files[i]
+            print(f"\n🔄 完成文件 {done}/{len(document_files)}: {Path(file_path).name}")
 
-        # 合并结果
-        combined_result = {
-            **chunking_result,
-            **token_result,
-            **chinese_result
-        }
+            try:
+                combined_result, log = future.result()
+                print(log, end="", flush=True)
+            except Exception as e:
+                print(f"✗ 文件处理失败: {e}")
+                combined_result = {
+                    "file_path": file_path,
+                    "file_extension": Path(file_path).suffix.lower(),
+                    "error": str(e)
+                }
 
-        all_results.append(combined_result)
+            # 保持与文件列表相同的顺序
+            all_results[i] = combined_result
 
     # 保存结果
     detailed_file, summary_file = save_test_results(all_results)
@@ -650,8 +789,7 @@ def main():
         # 保存单个文件结果
         output_file = f"{args.output_dir}/single_file_test_{Path(args.file).stem}.json"
         Path(args.output_dir).mkdir(exist_ok=True)
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
+        _save_json(result, output_file)
 
         print(f"✅ 结果已保存: {output_file}")
 
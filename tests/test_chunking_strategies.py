@@ -59,10 +59,12 @@ def test_chunking_strategies():
             print(f"   - 最大长度: {max_length} 字符")
             print(f"   - 最小长度: {min_length} 字符")
             
-            # 检查重复
-            unique_chunks = set(chunks)
-            if len(unique_chunks) < len(chunks):
-                duplicates = len(chunks) - len(unique_chunks)
+            # 检查重复：只有长度相同的chunk才可能重复，只对这些chunk做哈希比较
+            chunks_by_length = {}
+            for chunk, length in zip(chunks, chunk_lengths):
+                chunks_by_length.setdefault(length, []).append(chunk)
+            duplicates = sum(len(group) - len(set(group)) for group in chunks_by_length.values() if len(group) > 1)
+            if duplicates:
                 print(f"⚠️  发现重复: {duplicates} 个重复chunks")
             else:
                 print(f"✅ 无重复内容")
@@ -75,16 +77,15 @@ def test_chunking_strategies():
             
             # 保存结果到文件
             output_file = f"output/strategy_test_{strategy}_chunks.txt"
+            separator = "=" * 80
+            sub_separator = "-" * 40
             with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(f"策略: {strategy} - {description}\n")
-                f.write(f"总chunks数: {len(chunks)}\n")
-                f.write("=" * 80 + "\n\n")
-                
-                for i, chunk in enumerate(chunks):
-                    f.write(f"【Chunk {i+1:03d}】 (长度: {len(chunk)} 字符)\n")
-                    f.write("-" * 40 + "\n")
-                    f.write(chunk + "\n")
-                    f.write("=" * 80 + "\n\n")
+                f.write(f"策略: {strategy} - {description}\n总chunks数: {len(chunks)}\n{separator}\n\n")
+                # 每个chunk拼成一段写入
+                f.writelines(
+                    f"【Chunk {i+1:03d}】 (长度: {len(chunk)} 字符)\n{sub_separator}\n{chunk}\n{separator}\n\n"
+                    for i, chunk in enumerate(chunks)
+                )
             
             print(f"💾 结果已保存: {output_file}")
             
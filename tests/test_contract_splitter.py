@@ -1,13 +1,21 @@
 #!/usr/bin/env python3
 """
 Test suite for contract_splitter package.
+
+Set CHUNK_TEST_PARALLEL=1 to run the test classes in parallel through
+unittest-parallel (pip install unittest-parallel) when running this file
+directly; without it, or if unittest-parallel is not installed, the suite
+runs serially via TextTestRunner.
 """
 
 import unittest
 import tempfile
 import os
+import shutil
+import subprocess
 from pathlib import Path
 import sys
+from typing import Optional
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -88,9 +96,10 @@ class TestUtils(unittest.TestCase):
 class TestContractSplitter(unittest.TestCase):
     """Test main ContractSplitter class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.splitter = ContractSplitter(max_tokens=100, overlap=20)
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by all tests (tests do not mutate the splitter)."""
+        cls.splitter = ContractSplitter(max_tokens=100, overlap=20)
     
     def test_initialization(self):
         """Test splitter initialization."""
@@ -99,6 +108,17 @@ class TestContractSplitter(unittest.TestCase):
         self.assertTrue(self.splitter.split_by_sentence)
         self.assertEqual(self.splitter.token_counter, "character")
     
+    def test_reconfigure(self):
+        """Test reconfiguring sizing parameters on an existing splitter."""
+        splitter = ContractSplitter(max_tokens=100, overlap=20)
+        docx_splitter = splitter._get_docx_splitter()
+        splitter.reconfigure(max_tokens=500, overlap=50)
+        self.assertEqual(splitter.max_tokens, 500)
+        self.assertEqual(splitter.overlap, 50)
+        self.assertIs(splitter._get_docx_splitter(), docx_splitter)
+        self.assertEqual(docx_splitter.max_tokens, 500)
+        self.assertEqual(docx_splitter.overlap, 50)
+    
     def test_unsupported_file_type(self):
         """Test handling of unsupported file types."""
         with self.assertRaises(ValueError):
@@ -164,8 +184,20 @@ class TestContractSplitter(unittest.TestCase):
 class TestDocumentCreation(unittest.TestCase):
     """Test document creation and processing."""
     
-    def create_sample_docx(self):
-        """Create a sample DOCX file for testing."""
+    _sample_docx = None
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the cached sample document."""
+        if cls._sample_docx and os.path.exists(cls._sample_docx):
+            os.unlink(cls._sample_docx)
+    
+    @classmethod
+    def create_sample_docx(cls):
+        """Create a sample DOCX file for testing (generated once per class)."""
+        if cls._sample_docx is not None:
+            return cls._sample_docx
+        
         try:
             from docx import Document
             
@@ -181,8 +213,10 @@ class TestDocumentCreation(unittest.TestCase):
             
             # Save to temporary file
             temp_file = tempfile.NamedTemporaryFile(suffix='.docx', delete=False)
+            temp_file.close()
             doc.save(temp_file.name)
-            return temp_file.name
+            cls._sample_docx = temp_file.name
+            return cls._sample_docx
             
         except ImportError:
             return None
@@ -192,23 +226,18 @@ class TestDocumentCreation(unittest.TestCase):
         docx_file = self.create_sample_docx()
         
         if docx_file:
-            try:
-                splitter = ContractSplitter(max_tokens=200, overlap=50)
-                sections = splitter.split(docx_file)
-                
-                self.assertGreater(len(sections), 0)
-                
-                # Check that we have hierarchical structure
-                has_headings = any(section.get('heading') for section in sections)
-                self.assertTrue(has_headings)
-                
-                # Test flattening
-                chunks = splitter.flatten(sections)
-                self.assertGreater(len(chunks), 0)
-                
-            finally:
-                # Clean up
-                os.unlink(docx_file)
+            splitter = ContractSplitter(max_tokens=200, overlap=50)
+            sections = splitter.split(docx_file)
+            
+            self.assertGreater(len(sections), 0)
+            
+            # Check that we have hierarchical structure
+            has_headings = any(section.get('heading') for section in sections)
+            self.assertTrue(has_headings)
+            
+            # Test flattening
+            chunks = splitter.flatten(sections)
+            self.assertGreater(len(chunks), 0)
         else:
             self.skipTest("python-docx not available")
 
@@ -268,9 +297,10 @@ class TestIntegration(unittest.TestCase):
         self.assertGreater(len(chunks), 0)
         
         # Check that content is properly split
-        total_content = "".join(chunks)
-        self.assertIn("第一章", total_content)
-        self.assertIn("第一条", total_content)
+        self.assertTrue(any("第一章" in chunk for chunk in chunks),
+                        msg="第一章 not found in any chunk")
+        self.assertTrue(any("第一条" in chunk for chunk in chunks),
+                        msg="第一条 not found in any chunk")
         
         # Verify chunk sizes
         for chunk in chunks:
@@ -279,21 +309,8 @@ class TestIntegration(unittest.TestCase):
 
 def run_tests():
     """Run all tests and save results."""
-    # Create test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add test classes
-    test_classes = [
-        TestUtils,
-        TestContractSplitter,
-        TestDocumentCreation,
-        TestConvenienceFunctions,
-        TestIntegration
-    ]
-    
-    for test_class in test_classes:
-        tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        test_suite.addTests(tests)
+    # Create test suite from every TestCase class in this module
+    test_suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
@@ -303,28 +320,62 @@ def run_tests():
     output_dir = Path("output")
     output_dir.mkdir(exist_ok=True)
     
+    passed = result.testsRun - len(result.failures) - len(result.errors)
+    success_rate = passed / result.testsRun * 100 if result.testsRun else 0.0
+    
+    parts = [
+        "Test Results\n",
+        "============\n\n",
+        f"Tests run: {result.testsRun}\n",
+        f"Failures: {len(result.failures)}\n",
+        f"Errors: {len(result.errors)}\n",
+        f"Success rate: {success_rate:.1f}%\n\n",
+    ]
+    
+    if result.failures:
+        parts.append("Failures:\n")
+        parts.extend(f"- {test}: {traceback}\n" for test, traceback in result.failures)
+    
+    if result.errors:
+        parts.append("Errors:\n")
+        parts.extend(f"- {test}: {traceback}\n" for test, traceback in result.errors)
+    
     with open(output_dir / "test_results.txt", "w", encoding="utf-8") as f:
-        f.write(f"Test Results\n")
-        f.write(f"============\n\n")
-        f.write(f"Tests run: {result.testsRun}\n")
-        f.write(f"Failures: {len(result.failures)}\n")
-        f.write(f"Errors: {len(result.errors)}\n")
-        f.write(f"Success rate: {(result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun * 100:.1f}%\n\n")
-        
-        if result.failures:
-            f.write("Failures:\n")
-            for test, traceback in result.failures:
-                f.write(f"- {test}: {traceback}\n")
-        
-        if result.errors:
-            f.write("Errors:\n")
-            for test, traceback in result.errors:
-                f.write(f"- {test}: {traceback}\n")
+        f.write("".join(parts))
     
     return result
 
 
+def run_tests_parallel() -> Optional[int]:
+    """Run this module's test classes in parallel via unittest-parallel.
+
+    Returns the runner's exit code, or None if unittest-parallel is not
+    installed. Results are reported on the console only.
+    """
+    executable = shutil.which("unittest-parallel")
+    if executable is None:
+        return None
+    
+    tests_dir = Path(__file__).parent
+    completed = subprocess.run([
+        executable,
+        "-t", str(tests_dir),
+        "-s", str(tests_dir),
+        "-p", Path(__file__).name,
+        "-j", str(os.cpu_count() or 1),
+        "--level", "class",
+    ])
+    return completed.returncode
+
+
 if __name__ == "__main__":
+    if os.getenv("CHUNK_TEST_PARALLEL"):
+        print("Running contract_splitter test suite in parallel...")
+        returncode = run_tests_parallel()
+        if returncode is not None:
+            sys.exit(returncode)
+        print("unittest-parallel not available, falling back to serial run")
+    
     print("Running contract_splitter test suite...")
     result = run_tests()
     
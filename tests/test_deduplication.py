@@ -4,18 +4,60 @@
 """
 
 import os
+import re
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from contract_splitter import ContractSplitter
 
 
-def advanced_deduplication(chunks):
+# 指纹中要移除的格式标记：chunk标题、分隔符、长度说明
+_CHUNK_HEADER_RE = re.compile(r'【Chunk \d+】.*?\n')
+_EQUALS_LINE_RE = re.compile(r'={50,}')
+_DASH_LINE_RE = re.compile(r'-{20,}')
+_LENGTH_NOTE_RE = re.compile(r'\(长度: \d+ 字符\)')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+try:
+    _popcount = int.bit_count  # Python 3.10+
+except AttributeError:
+    def _popcount(value):
+        return bin(value).count("1")
+
+
+def _char_bitmap(text, char_bits):
+    """
+    把文本的字符集编码成整数位图
+    
+    Args:
+        text: 文本内容
+        char_bits: 字符 -> 位序号的共享映射，遇到新字符时追加
+        
+    Returns:
+        每个出现过的字符对应一位的整数
+    """
+    bitmap = 0
+    for char in set(text):
+        bit = char_bits.get(char)
+        if bit is None:
+            bit = char_bits[char] = len(char_bits)
+        bitmap |= 1 << bit
+    return bitmap
+
+
+def advanced_deduplication(chunks, threshold=0.7):
     """
     高级去重功能：检测并移除重复和高度相似的chunks
     
+    每个指纹的小写字符集编码成整数位图，交集/并集大小用按位与/或后的
+    popcount得到，比较时不再构造集合。已保留的指纹按字符集大小分桶：
+    两个字符集的Jaccard相似度不超过较小集合与较大集合的大小之比，
+    所以大小相差过多的桶整个跳过，结果与两两比较完全一致。
+    
     Args:
         chunks: 原始chunks列表
+        threshold: 相似度阈值
         
     Returns:
         去重后的chunks列表
@@ -24,22 +66,28 @@ def advanced_deduplication(chunks):
         return chunks
     
     unique_chunks = []
-    seen_fingerprints = set()
+    char_bits = {}  # 字符 -> 位序号
+    seen_by_charset_size = {}  # 字符集大小 -> {指纹位图}
     
     for i, chunk in enumerate(chunks):
-        # 创建内容指纹
+        # 创建内容指纹，字符集位图只计算一次
         fingerprint = create_content_fingerprint(chunk)
+        bitmap = _char_bitmap(fingerprint.lower(), char_bits)
+        size = _popcount(bitmap)
         
-        # 检查是否与已有chunks重复
+        # 只检查字符集大小足够接近的已有chunks；空指纹不与任何chunk相似
         is_duplicate = False
-        for seen_fp in seen_fingerprints:
-            if chunks_are_similar(fingerprint, seen_fp, threshold=0.7):
-                print(f"🔍 发现重复chunk {i+1}: 与之前的chunk相似度过高")
-                is_duplicate = True
-                break
+        if fingerprint:
+            for seen_size, seen_bitmaps in seen_by_charset_size.items():
+                if min(size, seen_size) < threshold * max(size, seen_size):
+                    continue
+                if any(_popcount(bitmap & seen) / _popcount(bitmap | seen) >= threshold for seen in seen_bitmaps):
+                    print(f"🔍 发现重复chunk {i+1}: 与之前的chunk相似度过高")
+                    is_duplicate = True
+                    break
         
         if not is_duplicate:
-            seen_fingerprints.add(fingerprint)
+            seen_by_charset_size.setdefault(size, set()).add(bitmap)
             unique_chunks.append(chunk)
         
     return unique_chunks
@@ -55,23 +103,39 @@ def create_content_fingerprint(text):
     Returns:
         内容指纹字符串
     """
-    # 移除格式标记和空白字符
-    import re
-    
     # 移除chunk标题和分隔符
-    clean_text = re.sub(r'【Chunk \d+】.*?\n', '', text)
-    clean_text = re.sub(r'={50,}', '', clean_text)
-    clean_text = re.sub(r'-{20,}', '', clean_text)
-    clean_text = re.sub(r'\(长度: \d+ 字符\)', '', clean_text)
+    clean_text = _CHUNK_HEADER_RE.sub('', text)
+    clean_text = _EQUALS_LINE_RE.sub('', clean_text)
+    clean_text = _DASH_LINE_RE.sub('', clean_text)
+    clean_text = _LENGTH_NOTE_RE.sub('', clean_text)
     
     # 移除多余空白
-    clean_text = re.sub(r'\s+', ' ', clean_text).strip()
+    clean_text = _WHITESPACE_RE.sub(' ', clean_text).strip()
     
     # 取前500字符作为指纹
     return clean_text[:500]
 
 
-def chunks_are_similar(text1, text2, threshold=0.7):
+def count_pattern_hits(chunks, patterns):
+    """
+    一次遍历统计每个模式出现在多少个chunks中
+    
+    Args:
+        chunks: chunks列表
+        patterns: 要统计的子串列表
+        
+    Returns:
+        与patterns一一对应的计数列表
+    """
+    counts = [0] * len(patterns)
+    for chunk in chunks:
+        for i, pattern in enumerate(patterns):
+            if pattern in chunk:
+                counts[i] += 1
+    return counts
+
+
+def chunks_are_similar(text1, text2, threshold=0.7, chars1=None, chars2=None):
     """
     检查两个文本是否相似
     
@@ -79,6 +143,8 @@ def chunks_are_similar(text1, text2, threshold=0.7):
         text1: 第一个文本
         text2: 第二个文本
         threshold: 相似度阈值
+        chars1: 预先计算好的text1小写字符集（可选）
+        chars2: 预先计算好的text2小写字符集（可选）
         
     Returns:
         True if similar
@@ -87,8 +153,8 @@ def chunks_are_similar(text1, text2, threshold=0.7):
         return False
     
     # 计算字符级别的相似度
-    set1 = set(text1.lower())
-    set2 = set(text2.lower())
+    set1 = chars1 if chars1 is not None else set(text1.lower())
+    set2 = chars2 if chars2 is not None else set(text2.lower())
     
     intersection = len(set1.intersection(set2))
     union = len(set1.union(set2))
@@ -142,20 +208,19 @@ def test_deduplication():
         ]
         
         print("\n🔍 检查特定重复模式:")
-        for pattern in duplicate_patterns:
-            original_count = sum(1 for chunk in original_chunks if pattern in chunk)
-            deduplicated_count = sum(1 for chunk in deduplicated_chunks if pattern in chunk)
-            
+        original_counts = count_pattern_hits(original_chunks, duplicate_patterns)
+        deduplicated_counts = count_pattern_hits(deduplicated_chunks, duplicate_patterns)
+        for pattern, original_count, deduplicated_count in zip(
+                duplicate_patterns, original_counts, deduplicated_counts):
             print(f"  '{pattern[:20]}...': {original_count} -> {deduplicated_count}")
         
         # 保存去重后的结果
         output_file = "output/deduplicated_chunks.txt"
         with open(output_file, 'w', encoding='utf-8') as f:
-            for i, chunk in enumerate(deduplicated_chunks, 1):
-                f.write(f"【Chunk {i:03d}】 (长度: {len(chunk)} 字符)\n")
-                f.write("-" * 40 + "\n")
-                f.write(chunk + "\n")
-                f.write("=" * 80 + "\n\n")
+            f.writelines(
+                f"【Chunk {i:03d}】 (长度: {len(chunk)} 字符)\n{'-' * 40}\n{chunk}\n{'=' * 80}\n\n"
+                for i, chunk in enumerate(deduplicated_chunks, 1)
+            )
         
         print(f"\n✅ 去重后的结果已保存到: {output_file}")
         
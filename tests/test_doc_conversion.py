@@ -33,13 +33,13 @@ def test_doc_conversion():
         docx_path = converter.convert_to_docx(doc_file)
         print(f"✓ Conversion successful: {docx_path}")
         
-        # Check file size
-        if os.path.exists(docx_path):
-            size = os.path.getsize(docx_path)
-            print(f"✓ Output file size: {size} bytes")
-        else:
+        # Check file size (a single stat covers both existence and size)
+        try:
+            size = os.stat(docx_path).st_size
+        except FileNotFoundError:
             print("✗ Output file not found")
             return
+        print(f"✓ Output file size: {size} bytes")
             
     except Exception as e:
         print(f"✗ Conversion failed: {e}")
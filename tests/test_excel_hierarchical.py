@@ -7,6 +7,7 @@
 import unittest
 import tempfile
 import os
+from io import BytesIO
 from pathlib import Path
 import sys
 
@@ -19,30 +20,46 @@ from contract_splitter import split_document, flatten_sections, SplitterFactory,
 class TestExcelHierarchicalChunking(unittest.TestCase):
     """测试Excel文件的分层chunk功能"""
     
-    def setUp(self):
-        """设置测试环境"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_excel_file = self.create_test_excel_file()
+    # 序列化好的测试工作簿，进程内只用openpyxl生成一次
+    _xlsx_bytes = None
     
-    def tearDown(self):
+    @classmethod
+    def setUpClass(cls):
+        """设置测试环境：各测试只读取Excel文件，整个类共用一份"""
+        cls._temp_dir_handle = tempfile.TemporaryDirectory()
+        cls.temp_dir = cls._temp_dir_handle.name
+        cls.test_excel_file = cls.create_test_excel_file()
+    
+    @classmethod
+    def tearDownClass(cls):
         """清理测试环境"""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        cls._temp_dir_handle.cleanup()
     
-    def create_test_excel_file(self):
-        """创建测试Excel文件"""
-        try:
-            import openpyxl
-        except ImportError:
-            self.skipTest("openpyxl not available")
+    @classmethod
+    def create_test_excel_file(cls):
+        """创建测试Excel文件：写入缓存的工作簿字节"""
+        if cls._xlsx_bytes is None:
+            try:
+                cls._xlsx_bytes = cls.build_test_workbook_bytes()
+            except ImportError:
+                cls._temp_dir_handle.cleanup()
+                raise unittest.SkipTest("openpyxl not available")
+        
+        test_file = os.path.join(cls.temp_dir, "test_legal_excel.xlsx")
+        Path(test_file).write_bytes(cls._xlsx_bytes)
         
+        return test_file
+    
+    @staticmethod
+    def build_test_workbook_bytes():
+        """用openpyxl生成测试工作簿并序列化到内存"""
         from openpyxl import Workbook
         
-        wb = Workbook()
+        # 只写模式：行直接流式写出，不建立单元格模型
+        wb = Workbook(write_only=True)
         
         # 第一个工作表：法律条文
-        ws1 = wb.active
-        ws1.title = "法律条文"
+        ws1 = wb.create_sheet("法律条文")
         
         legal_data = [
             ["条文编号", "条文内容", "适用范围"],
@@ -69,11 +86,11 @@ class TestExcelHierarchicalChunking(unittest.TestCase):
         for row_data in indicator_data:
             ws2.append(row_data)
         
-        # 保存文件
-        test_file = os.path.join(self.temp_dir, "test_legal_excel.xlsx")
-        wb.save(test_file)
+        # 保存到内存
+        buffer = BytesIO()
+        wb.save(buffer)
         
-        return test_file
+        return buffer.getvalue()
     
     def test_split_document_excel_support(self):
         """测试split_document函数对Excel的支持"""
@@ -89,10 +106,10 @@ class TestExcelHierarchicalChunking(unittest.TestCase):
             self.assertGreater(len(chunk.strip()), 0)
         
         # 验证包含Excel内容（法律条文或表格数据）
-        all_content = ' '.join(chunks)
         self.assertTrue(
-            '第一条' in all_content or '第二条' in all_content or '指标类别' in all_content,
-            f"Should contain Excel content, got: {all_content[:200]}..."
+            any('第一条' in chunk or '第二条' in chunk or '指标类别' in chunk
+                for chunk in chunks),
+            msg=f"Should contain Excel content, got: {chunks[:3]}..."
         )
     
     def test_split_document_excel_with_extract_mode(self):
@@ -179,10 +196,10 @@ class TestExcelHierarchicalChunking(unittest.TestCase):
             self.assertGreater(len(chunk.strip()), 0)
         
         # 验证包含Excel内容
-        all_content = ' '.join(chunks)
         self.assertTrue(
-            '第一条' in all_content or '第二条' in all_content or '指标类别' in all_content,
-            f"Should contain Excel content, got: {all_content[:200]}..."
+            any('第一条' in chunk or '第二条' in chunk or '指标类别' in chunk
+                for chunk in chunks),
+            msg=f"Should contain Excel content, got: {chunks[:3]}..."
         )
     
     def test_flatten_sections_function_excel(self):
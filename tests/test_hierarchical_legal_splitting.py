@@ -3,74 +3,112 @@
 测试层次化法律条文切分功能
 """
 
+import io
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from contract_splitter.domain_helpers import split_legal_document
+from contract_splitter.legal_structure_detector import get_legal_detector, LegalStructureLevel
+
+
+# 结构分析用到的层级数值，模块加载时解析一次
+CHAPTER_LEVELS = frozenset({LegalStructureLevel.CHAPTER.value, LegalStructureLevel.BOOK.value})
+ARTICLE_LEVEL = LegalStructureLevel.ARTICLE.value
+ENUMERATION_LEVEL = LegalStructureLevel.ENUMERATION.value
+
+LAW_DIR = 'output/law'
+
+# 最近一次切分测试的结果，compare_with_previous_results等复用，避免重复切分
+_LAST_RESULTS = None
+
+
+def list_dir_names(directory):
+    """一次scandir列出目录中的条目名，目录不存在时返回空集合"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
 
 
 def test_hierarchical_legal_splitting():
-    """测试层次化法律条文切分"""
+    """测试层次化法律条文切分（同一进程内只切分一次，之后返回缓存结果）"""
+    global _LAST_RESULTS
+    if _LAST_RESULTS is not None:
+        return _LAST_RESULTS
     
     print("🔍 层次化法律条文切分测试")
     print("=" * 80)
     
     # 测试文件列表
     test_files = [
-        'output/law/9147de404f6d4df986b0cb41acd47aac.wps',
-        'output/law/证券公司监督管理条例(2014年修订).docx',
-        'output/law/附件1.期货公司互联网营销管理暂行规定.pdf'
+        os.path.join(LAW_DIR, '9147de404f6d4df986b0cb41acd47aac.wps'),
+        os.path.join(LAW_DIR, '证券公司监督管理条例(2014年修订).docx'),
+        os.path.join(LAW_DIR, '附件1.期货公司互联网营销管理暂行规定.pdf')
     ]
     
     results = {}
     
+    # 测试文件都在同一目录下，列一次目录代替逐个stat
+    existing_names = list_dir_names(LAW_DIR)
+    
+    existing_files = []
     for test_file in test_files:
-        if not os.path.exists(test_file):
+        if os.path.basename(test_file) not in existing_names:
             print(f"⚠️  文件不存在: {test_file}")
             continue
+        existing_files.append(test_file)
+    
+    if existing_files:
+        # 各文件的切分相互独立，交给进程池并行；结构分析需要共享检测器，留在主进程
+        max_workers = min(len(existing_files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(split_legal_document, test_file, max_tokens=1500)
+                for test_file in existing_files
+            ]
             
-        file_name = os.path.basename(test_file)
-        print(f"\n📄 测试文件: {file_name}")
-        print("-" * 60)
-        
-        try:
-            # 使用层次化切分
-            chunks = split_legal_document(test_file, max_tokens=1500)
-            
-            results[file_name] = {
-                'success': True,
-                'chunks_count': len(chunks),
-                'chunks': chunks
-            }
-            
-            print(f"✅ 处理成功: {len(chunks)} chunks")
-            
-            # 分析chunk结构
-            analyze_chunk_structure(chunks, file_name)
-            
-        except Exception as e:
-            results[file_name] = {
-                'success': False,
-                'error': str(e)
-            }
-            print(f"❌ 处理失败: {e}")
+            # 按文件列表顺序取结果，保证输出和汇总顺序稳定
+            for test_file, future in zip(existing_files, futures):
+                file_name = os.path.basename(test_file)
+                print(f"\n📄 测试文件: {file_name}")
+                print("-" * 60)
+                
+                try:
+                    # 使用层次化切分
+                    chunks = future.result()
+                    
+                    results[file_name] = {
+                        'success': True,
+                        'chunks_count': len(chunks),
+                        'chunks': chunks
+                    }
+                    
+                    print(f"✅ 处理成功: {len(chunks)} chunks")
+                    
+                    # 分析chunk结构
+                    analyze_chunk_structure(chunks, file_name)
+                    
+                except Exception as e:
+                    results[file_name] = {
+                        'success': False,
+                        'error': str(e)
+                    }
+                    print(f"❌ 处理失败: {e}")
     
     # 生成总结报告
     generate_summary_report(results)
     
+    _LAST_RESULTS = results
     return results
 
 
 def analyze_chunk_structure(chunks, file_name):
     """分析chunk结构"""
-    import sys
-    import os
-    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-    from contract_splitter.legal_structure_detector import get_legal_detector, LegalStructureLevel
-
-    print(f"\n📊 {file_name} 结构分析:")
+    buf = io.StringIO()
+    print(f"\n📊 {file_name} 结构分析:", file=buf)
 
     # 统计不同层次的chunk数量
     structure_stats = {
@@ -89,11 +127,11 @@ def analyze_chunk_structure(chunks, file_name):
         # 使用统一的结构检测器判断类型
         if detector.is_legal_heading(chunk):
             level = detector.get_heading_level(chunk)
-            if level == LegalStructureLevel.CHAPTER.value or level == LegalStructureLevel.BOOK.value:
+            if level in CHAPTER_LEVELS:
                 chunk_type = 'chapter'
-            elif level == LegalStructureLevel.ARTICLE.value:
+            elif level == ARTICLE_LEVEL:
                 chunk_type = 'article'
-            elif level >= LegalStructureLevel.ENUMERATION.value:
+            elif level >= ENUMERATION_LEVEL:
                 chunk_type = 'item'
 
         structure_stats[chunk_type] += 1
@@ -101,45 +139,53 @@ def analyze_chunk_structure(chunks, file_name):
     # 显示统计结果
     for type_name, count in structure_stats.items():
         if count > 0:
-            print(f"  {type_name}: {count}")
+            print(f"  {type_name}: {count}", file=buf)
     
     # 显示前3个chunk的预览
-    print(f"\n📝 前3个chunks预览:")
+    print(f"\n📝 前3个chunks预览:", file=buf)
     for i, chunk in enumerate(chunks[:3], 1):
-        print(f"\n  Chunk {i} (长度: {len(chunk)}):")
-        print("  " + "-" * 38)
+        chunk_length = len(chunk)
+        print(f"\n  Chunk {i} (长度: {chunk_length}):", file=buf)
+        print("  " + "-" * 38, file=buf)
         # 显示前200个字符
         preview = chunk[:200].replace('\n', ' ')
-        if len(chunk) > 200:
+        if chunk_length > 200:
             preview += "..."
-        print(f"  {preview}")
+        print(f"  {preview}", file=buf)
+
+    # 整段输出一次写入stdout
+    sys.stdout.write(buf.getvalue())
 
 
 def generate_summary_report(results):
     """生成总结报告"""
-    print("\n" + "=" * 80)
-    print("📊 层次化切分测试总结")
-    print("=" * 80)
+    buf = io.StringIO()
+    print("\n" + "=" * 80, file=buf)
+    print("📊 层次化切分测试总结", file=buf)
+    print("=" * 80, file=buf)
     
     total_files = len(results)
     successful_files = sum(1 for r in results.values() if r['success'])
     total_chunks = sum(r.get('chunks_count', 0) for r in results.values() if r['success'])
     
-    print(f"总文件数: {total_files}")
-    print(f"成功处理: {successful_files}")
-    print(f"成功率: {successful_files/total_files*100:.1f}%")
-    print(f"总chunks数: {total_chunks}")
+    print(f"总文件数: {total_files}", file=buf)
+    print(f"成功处理: {successful_files}", file=buf)
+    print(f"成功率: {successful_files/total_files*100:.1f}%", file=buf)
+    print(f"总chunks数: {total_chunks}", file=buf)
     
     if successful_files > 0:
         avg_chunks = total_chunks / successful_files
-        print(f"平均chunks数: {avg_chunks:.1f}")
+        print(f"平均chunks数: {avg_chunks:.1f}", file=buf)
     
-    print("\n📋 详细结果:")
+    print("\n📋 详细结果:", file=buf)
     for file_name, result in results.items():
         if result['success']:
-            print(f"  ✅ {file_name}: {result['chunks_count']} chunks")
+            print(f"  ✅ {file_name}: {result['chunks_count']} chunks", file=buf)
         else:
-            print(f"  ❌ {file_name}: {result['error']}")
+            print(f"  ❌ {file_name}: {result['error']}", file=buf)
+
+    # 整段输出一次写入stdout
+    sys.stdout.write(buf.getvalue())
 
 
 def compare_with_previous_results():
@@ -155,6 +201,7 @@ def compare_with_previous_results():
         '证券公司监督管理条例(2014年修订).docx': 22,
     }
     
+    # 复用已经跑过的切分结果
     current_results = test_hierarchical_legal_splitting()
     
     for file_name in previous_results:
@@ -4,11 +4,17 @@
 验证是否解决了条文被错误拆分的问题
 """
 
+import io
 import os
+import re
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from contract_splitter.domain_helpers import split_legal_document
+
+# 一次扫描即可找出条文编号和（一）…（五）项的标记
+_ARTICLE_MARKER_RE = re.compile(r'第[四五]条|（[一二三四五]）|\([一二]\)')
+
+FIFTH_ARTICLE_CONDITIONS = ('（一）', '（二）', '（三）', '（四）', '（五）')
 
 
 def test_improved_legal_splitting():
@@ -24,6 +30,8 @@ def test_improved_legal_splitting():
         print(f"⚠️  文件不存在: {test_file}")
         return
     
+    from contract_splitter.domain_helpers import split_legal_document
+    
     print(f"📄 测试文件: {os.path.basename(test_file)}")
     print("-" * 60)
     
@@ -49,42 +57,40 @@ def verify_article_integrity(chunks):
     """验证条文完整性"""
     print(f"\n📊 条文完整性验证:")
     
-    # 检查第四条是否完整
-    fourth_article_found = False
-    fourth_article_complete = False
+    # 单次遍历：每个chunk只做一次正则扫描，记录第四条和第五条所在的chunks
+    fourth_article = None
+    fifth_article_chunks = []
     
-    for i, chunk in enumerate(chunks):
-        if '第四条' in chunk:
-            fourth_article_found = True
-            print(f"  ✅ 找到第四条 (Chunk {i+1})")
-            
-            # 检查是否包含（一）和（二）
-            has_item_one = '（一）' in chunk or '(一)' in chunk
-            has_item_two = '（二）' in chunk or '(二)' in chunk
-            
-            if has_item_one and has_item_two:
-                fourth_article_complete = True
-                print(f"  ✅ 第四条包含完整的（一）和（二）项")
-            else:
-                print(f"  ❌ 第四条不完整: 包含（一）={has_item_one}, 包含（二）={has_item_two}")
-            break
+    for i, chunk in enumerate(chunks, 1):
+        markers = set(_ARTICLE_MARKER_RE.findall(chunk))
+        if fourth_article is None and '第四条' in markers:
+            fourth_article = (i, markers)
+        if '第五条' in markers:
+            fifth_article_chunks.append((i, markers))
     
-    if not fourth_article_found:
+    # 检查第四条是否完整
+    if fourth_article is not None:
+        chunk_num, markers = fourth_article
+        print(f"  ✅ 找到第四条 (Chunk {chunk_num})")
+        
+        # 检查是否包含（一）和（二）
+        has_item_one = '（一）' in markers or '(一)' in markers
+        has_item_two = '（二）' in markers or '(二)' in markers
+        
+        if has_item_one and has_item_two:
+            print(f"  ✅ 第四条包含完整的（一）和（二）项")
+        else:
+            print(f"  ❌ 第四条不完整: 包含（一）={has_item_one}, 包含（二）={has_item_two}")
+    else:
         print(f"  ❌ 未找到第四条")
     
     # 检查第五条的条件是否被错误拆分
-    fifth_article_chunks = []
-    for i, chunk in enumerate(chunks):
-        if '第五条' in chunk:
-            fifth_article_chunks.append((i+1, chunk))
-    
     if len(fifth_article_chunks) == 1:
-        chunk_num, chunk_content = fifth_article_chunks[0]
+        chunk_num, markers = fifth_article_chunks[0]
         print(f"  ✅ 第五条在单个chunk中 (Chunk {chunk_num})")
         
         # 检查是否包含多个条件
-        conditions = ['（一）', '（二）', '（三）', '（四）', '（五）']
-        found_conditions = [cond for cond in conditions if cond in chunk_content]
+        found_conditions = [cond for cond in FIFTH_ARTICLE_CONDITIONS if cond in markers]
         
         if len(found_conditions) >= 2:
             print(f"  ✅ 第五条包含多个条件: {found_conditions}")
@@ -96,20 +102,25 @@ def verify_article_integrity(chunks):
 
 def show_chunk_details(chunks):
     """显示chunk详细内容"""
-    print(f"\n📋 前{len(chunks)}个chunks详细内容:")
-    print("=" * 80)
+    buf = io.StringIO()
+    print(f"\n📋 前{len(chunks)}个chunks详细内容:", file=buf)
+    print("=" * 80, file=buf)
     
     for i, chunk in enumerate(chunks, 1):
-        print(f"\n📋 Chunk {i} (长度: {len(chunk)} 字符)")
-        print("-" * 50)
+        chunk_length = len(chunk)
+        print(f"\n📋 Chunk {i} (长度: {chunk_length} 字符)", file=buf)
+        print("-" * 50, file=buf)
         
         # 显示chunk内容，限制长度
-        if len(chunk) <= 500:
-            print(chunk)
+        if chunk_length <= 500:
+            print(chunk, file=buf)
         else:
-            print(chunk[:500] + "\n... (内容过长，已截断)")
+            print(chunk[:500] + "\n... (内容过长，已截断)", file=buf)
         
-        print("=" * 50)
+        print("=" * 50, file=buf)
+
+    # 整段输出一次写入stdout
+    sys.stdout.write(buf.getvalue())
 
 
 def compare_with_previous_issues():
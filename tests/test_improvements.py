@@ -10,15 +10,11 @@ import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from contract_splitter import DocxSplitter
-from contract_splitter.domain_helpers import (
-    split_legal_document,
-    split_contract,
-    split_regulation,
-    LegalClauseSplitter,
-    DomainContractSplitter,
-    RegulationSplitter
-)
+
+def parse_config_key(splitter_config):
+    """文档解析只依赖除chunking_strategy以外的切分参数，用它们作为复用解析结果的键"""
+    return repr(sorted((key, value) for key, value in splitter_config.items()
+                       if key != 'chunking_strategy'))
 
 
 def test_text_cleaning():
@@ -56,6 +52,8 @@ def test_strict_max_tokens():
         print(f"❌ 测试文件不存在: {test_file}")
         return
     
+    from contract_splitter import DocxSplitter
+    
     # 测试不严格控制（默认）
     print("📋 不严格控制chunk大小:")
     splitter_loose = DocxSplitter(
@@ -67,13 +65,13 @@ def test_strict_max_tokens():
     chunks_loose = splitter_loose.flatten(sections)
     
     print(f"  总chunks: {len(chunks_loose)}")
-    oversized_loose = [i for i, chunk in enumerate(chunks_loose)
-                      if len(chunk) > 1000]
+    # 每个chunk的长度只算一次，后面的统计都复用
+    lengths_loose = [len(chunk) for chunk in chunks_loose]
+    oversized_loose = [i for i, size in enumerate(lengths_loose) if size > 1000]
     print(f"  超过1000字符的chunks: {len(oversized_loose)}")
     if oversized_loose:
         for i in oversized_loose[:3]:  # 显示前3个
-            size = len(chunks_loose[i])
-            print(f"    Chunk {i+1}: {size} 字符")
+            print(f"    Chunk {i+1}: {lengths_loose[i]} 字符")
     
     # 测试严格控制
     print("\n📋 严格控制chunk大小:")
@@ -83,22 +81,21 @@ def test_strict_max_tokens():
         strict_max_tokens=True
     )
     
-    sections = splitter_strict.split(test_file)
-    chunks_strict = splitter_strict.flatten(sections)
+    sections_strict = splitter_strict.split(test_file)
+    chunks_strict = splitter_strict.flatten(sections_strict)
     
     print(f"  总chunks: {len(chunks_strict)}")
-    oversized_strict = [i for i, chunk in enumerate(chunks_strict)
-                       if len(chunk) > 1000]
+    lengths_strict = [len(chunk) for chunk in chunks_strict]
+    oversized_strict = [i for i, size in enumerate(lengths_strict) if size > 1000]
     print(f"  超过1000字符的chunks: {len(oversized_strict)}")
     if oversized_strict:
         for i in oversized_strict[:3]:  # 显示前3个
-            size = len(chunks_strict[i])
-            print(f"    Chunk {i+1}: {size} 字符")
+            print(f"    Chunk {i+1}: {lengths_strict[i]} 字符")
     
     # 显示chunk大小分布
     print(f"\n📊 Chunk大小分布:")
-    print(f"  不严格控制: 平均{sum(len(c) for c in chunks_loose)/len(chunks_loose):.0f}字符")
-    print(f"  严格控制: 平均{sum(len(c) for c in chunks_strict)/len(chunks_strict):.0f}字符")
+    print(f"  不严格控制: 平均{sum(lengths_loose)/len(lengths_loose):.0f}字符")
+    print(f"  严格控制: 平均{sum(lengths_strict)/len(lengths_strict):.0f}字符")
 
 
 def test_domain_helpers():
@@ -112,23 +109,41 @@ def test_domain_helpers():
         print(f"❌ 测试文件不存在: {test_file}")
         return
     
+    from contract_splitter.domain_helpers import (
+        split_legal_document,
+        DomainContractSplitter,
+        RegulationSplitter
+    )
+    
     # 测试法律条款切分器
     print("⚖️ 法律条款切分器:")
     try:
         legal_chunks = split_legal_document(test_file, max_tokens=1500)
+        legal_lengths = [len(chunk) for chunk in legal_chunks]
         print(f"  法律文档切分: {len(legal_chunks)} 个chunks")
-        print(f"  平均长度: {sum(len(c) for c in legal_chunks)/len(legal_chunks):.0f} 字符")
-        print(f"  最大长度: {max(len(c) for c in legal_chunks)} 字符")
+        print(f"  平均长度: {sum(legal_lengths)/len(legal_lengths):.0f} 字符")
+        print(f"  最大长度: {max(legal_lengths)} 字符")
     except Exception as e:
         print(f"  ❌ 法律切分失败: {e}")
     
+    # 切分参数相同的类型共用一次文档解析，只按各自策略展开
+    parsed_sections = {}
+    
+    def shared_sections(domain_splitter):
+        key = parse_config_key(domain_splitter.splitter_config)
+        if key not in parsed_sections:
+            parsed_sections[key] = domain_splitter.parse_document(test_file)
+        return parsed_sections[key]
+    
     # 测试合同切分器
     print("\n📄 合同切分器:")
     contract_types = ["general", "service", "purchase"]
     
     for contract_type in contract_types:
         try:
-            contract_chunks = split_contract(test_file, contract_type=contract_type)
+            contract_splitter = DomainContractSplitter(contract_type=contract_type)
+            contract_chunks = contract_splitter.split_contract(
+                test_file, sections=shared_sections(contract_splitter))
             print(f"  {contract_type}合同: {len(contract_chunks)} 个chunks")
         except Exception as e:
             print(f"  ❌ {contract_type}合同切分失败: {e}")
@@ -139,7 +154,9 @@ def test_domain_helpers():
     
     for regulation_type in regulation_types:
         try:
-            regulation_chunks = split_regulation(test_file, regulation_type=regulation_type)
+            regulation_splitter = RegulationSplitter(regulation_type=regulation_type)
+            regulation_chunks = regulation_splitter.split_regulation(
+                test_file, sections=shared_sections(regulation_splitter))
             print(f"  {regulation_type}规章: {len(regulation_chunks)} 个chunks")
         except Exception as e:
             print(f"  ❌ {regulation_type}规章切分失败: {e}")
@@ -156,6 +173,12 @@ def test_domain_splitter_classes():
         print(f"❌ 测试文件不存在: {test_file}")
         return
     
+    from contract_splitter.domain_helpers import (
+        LegalClauseSplitter,
+        DomainContractSplitter,
+        RegulationSplitter
+    )
+    
     # 测试法律条款切分器类
     print("⚖️ LegalClauseSplitter:")
     try:
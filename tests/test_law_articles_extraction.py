@@ -6,71 +6,27 @@
 
 import os
 import sys
-import tempfile
 import logging
+from contextlib import suppress
 from pathlib import Path
 
 # 添加项目根目录到路径
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from contract_splitter.excel_processor import ExcelProcessor
-from contract_splitter.excel_splitter import ExcelSplitter
+from _fixtures_data import create_law_articles_excel_file
 
 # 设置日志
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def create_test_excel_file():
-    """创建测试用的Excel文件，模拟法规名称-条文-内容格式"""
-    try:
-        import openpyxl
-        from openpyxl import Workbook
-        
-        # 创建工作簿
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "法律条文"
-        
-        # 添加标题行
-        ws['A1'] = "法规名称"
-        ws['B1'] = "条文内容"
-
-        # 添加测试数据（2列格式：法规名称 + 条文内容）
-        test_data = [
-            ["中华人民共和国工业产品生产许可证管理条例", "第一条 为了保证直接关系公共安全、人体健康、生命财产安全的重要工业产品的质量安全，贯彻国家产业政策，促进经济社会发展，制定本条例。"],
-            ["中华人民共和国工业产品生产许可证管理条例", "第二条 国家对直接关系公共安全、人体健康、生命财产安全的重要工业产品，实行生产许可证制度。"],
-            ["中华人民共和国工业产品生产许可证管理条例", "第三条 企业未依照本条例规定取得生产许可证的，不得生产列入目录的产品。任何单位和个人不得销售或者在经营活动中使用未取得生产许可证的列入目录的产品。"],
-            ["中华人民共和国工业产品生产许可证管理条例", "第四条 国务院质量技术监督部门负责全国工业产品生产许可证统一管理工作。国务院有关部门在各自的职责范围内负责相关工业产品生产许可证管理工作。"],
-            ["中华人民共和国工业产品生产许可证管理条例", "第五条 县级以上地方质量技术监督部门负责本行政区域内工业产品生产许可证管理工作。"],
-        ]
-
-        # 写入数据
-        for i, (law_name, article_content) in enumerate(test_data, start=2):
-            ws[f'A{i}'] = law_name
-            ws[f'B{i}'] = article_content
-        
-        # 保存到临时文件
-        temp_file = tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False)
-        wb.save(temp_file.name)
-        wb.close()
-        
-        return temp_file.name
-        
-    except ImportError:
-        logger.error("openpyxl未安装，无法创建测试Excel文件")
-        return None
-
-
-def test_excel_processor_law_articles():
+def test_excel_processor_law_articles(law_articles_excel_file):
     """测试ExcelProcessor的law_articles模式"""
     logger.info("=== 测试ExcelProcessor的law_articles模式 ===")
     
-    # 创建测试文件
-    test_file = create_test_excel_file()
-    if not test_file:
-        logger.error("无法创建测试文件")
-        return False
+    from contract_splitter.excel_processor import ExcelProcessor
+    
+    test_file = law_articles_excel_file
     
     try:
         # 初始化处理器
@@ -113,21 +69,15 @@ def test_excel_processor_law_articles():
     except Exception as e:
         logger.error(f"测试过程中出现错误: {e}")
         return False
-    finally:
-        # 清理临时文件
-        if os.path.exists(test_file):
-            os.unlink(test_file)
 
 
-def test_excel_splitter_law_articles():
+def test_excel_splitter_law_articles(law_articles_excel_file):
     """测试ExcelSplitter的law_articles模式"""
     logger.info("=== 测试ExcelSplitter的law_articles模式 ===")
     
-    # 创建测试文件
-    test_file = create_test_excel_file()
-    if not test_file:
-        logger.error("无法创建测试文件")
-        return False
+    from contract_splitter.excel_splitter import ExcelSplitter
+    
+    test_file = law_articles_excel_file
     
     try:
         # 初始化分割器
@@ -186,26 +136,30 @@ def test_excel_splitter_law_articles():
             logger.error("未生成任何块")
             return False
             
-    except Exception as e:
-        logger.error(f"测试过程中出现错误: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("测试过程中出现错误")
         return False
-    finally:
-        # 清理临时文件
-        if os.path.exists(test_file):
-            os.unlink(test_file)
 
 
 def main():
     """主测试函数"""
     logger.info("开始测试法律条文提取功能")
     
-    # 测试ExcelProcessor
-    processor_success = test_excel_processor_law_articles()
+    # 两个测试共用同一个测试文件
+    test_file = create_law_articles_excel_file()
+    if not test_file:
+        logger.error("无法创建测试文件")
+        return False
     
-    # 测试ExcelSplitter
-    splitter_success = test_excel_splitter_law_articles()
+    try:
+        # 测试ExcelProcessor
+        processor_success = test_excel_processor_law_articles(test_file)
+        
+        # 测试ExcelSplitter
+        splitter_success = test_excel_splitter_law_articles(test_file)
+    finally:
+        with suppress(FileNotFoundError):
+            os.unlink(test_file)
     
     # 总结结果
     logger.info("\n" + "=" * 60)
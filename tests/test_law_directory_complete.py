@@ -7,12 +7,28 @@
 import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from contract_splitter.domain_helpers import split_legal_document
+from contract_splitter.legal_structure_detector import get_legal_detector, LegalStructureLevel
+
+
+# 所有文件共用一个结构检测器，结构分析用到的层级数值在模块加载时解析一次
+_LEGAL_DETECTOR = get_legal_detector("legal")
+CHAPTER_LEVELS = frozenset({
+    LegalStructureLevel.CHAPTER.value,
+    LegalStructureLevel.BOOK.value,
+    LegalStructureLevel.PART.value,
+})
+ARTICLE_LEVEL = LegalStructureLevel.ARTICLE.value
+CLAUSE_LEVELS = frozenset({LegalStructureLevel.CLAUSE.value, LegalStructureLevel.ITEM.value})
+ENUMERATION_LEVEL = LegalStructureLevel.ENUMERATION.value
+
+SUPPORTED_EXTENSIONS = ('.docx', '.doc', '.pdf', '.wps')
 
 
 def test_law_directory_complete():
@@ -31,12 +47,8 @@ def test_law_directory_complete():
         print(f"❌ 目录不存在: {law_dir}")
         return
     
-    # 获取所有支持的文件
-    supported_extensions = ['.docx', '.doc', '.pdf', '.wps']
-    law_files = []
-    
-    for ext in supported_extensions:
-        law_files.extend(law_dir.glob(f"*{ext}"))
+    # 获取所有支持的文件及其大小
+    law_files = list_law_files(law_dir)
     
     if not law_files:
         print(f"❌ 在 {law_dir} 中没有找到支持的文件")
@@ -49,49 +61,38 @@ def test_law_directory_complete():
     results = {}
     total_chunks = 0
     
-    for i, file_path in enumerate(law_files, 1):
-        file_name = file_path.name
-        print(f"[{i}/{len(law_files)}] 📄 处理: {file_name}")
-        print("-" * 60)
+    # 各文件的切分和保存相互独立，交给进程池并行；按文件顺序输出，保证结果稳定
+    max_workers = get_worker_count()
+    with ThreadPoolExecutor(max_workers=1) as prefetcher, \
+            ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # 前max_workers个文件会立即开始处理，排队的文件在后台线程中提前读入页缓存
+        for file_path, _ in law_files[max_workers:]:
+            prefetcher.submit(_prefetch, str(file_path))
         
-        start_time = time.time()
+        futures = [
+            executor.submit(_process_one, str(file_path), 1500, output_dir)
+            for file_path, _ in law_files
+        ]
         
-        try:
-            # 使用法律文档专用切分器
-            chunks = split_legal_document(str(file_path), max_tokens=1500)
-            
-            # 保存chunks到文件
-            output_file = save_law_chunks_to_file(file_name, chunks, output_dir, str(file_path))
-            
-            processing_time = time.time() - start_time
+        for i, (future, (_, file_size)) in enumerate(zip(futures, law_files), 1):
+            file_name, result = future.result()
+            print(f"[{i}/{len(law_files)}] 📄 处理: {file_name}")
+            print("-" * 60)
             
-            results[file_name] = {
-                'success': True,
-                'chunks_count': len(chunks),
-                'output_file': output_file,
-                'processing_time': processing_time,
-                'file_size': file_path.stat().st_size
-            }
+            results[file_name] = result
             
-            total_chunks += len(chunks)
-            
-            print(f"✅ 成功: {len(chunks)} chunks")
-            print(f"⏱️  耗时: {processing_time:.2f}s")
-            print(f"💾 保存到: {output_file}")
-            
-        except Exception as e:
-            processing_time = time.time() - start_time
-            
-            results[file_name] = {
-                'success': False,
-                'error': str(e),
-                'processing_time': processing_time
-            }
+            if result['success']:
+                result['file_size'] = file_size
+                total_chunks += result['chunks_count']
+                
+                print(f"✅ 成功: {result['chunks_count']} chunks")
+                print(f"⏱️  耗时: {result['processing_time']:.2f}s")
+                print(f"💾 保存到: {result['output_file']}")
+            else:
+                print(f"❌ 失败: {result['error']}")
+                print(f"⏱️  耗时: {result['processing_time']:.2f}s")
             
-            print(f"❌ 失败: {e}")
-            print(f"⏱️  耗时: {processing_time:.2f}s")
-        
-        print()
+            print()
     
     # 生成总结报告
     generate_law_test_report(results, total_chunks, output_dir)
@@ -99,6 +100,86 @@ def test_law_directory_complete():
     return results
 
 
+def list_law_files(law_dir: Path) -> list:
+    """
+    一次scandir列出目录中支持的文件，按扩展名分组排序
+    
+    Returns:
+        [(文件路径, 文件大小), ...]
+    """
+    grouped = {ext: [] for ext in SUPPORTED_EXTENSIONS}
+    with os.scandir(law_dir) as entries:
+        for entry in entries:
+            # 与glob("*")一致，跳过隐藏文件（如macOS的._foo.docx）
+            if entry.name.startswith('.') or not entry.is_file():
+                continue
+            for ext in SUPPORTED_EXTENSIONS:
+                if entry.name.endswith(ext):
+                    grouped[ext].append((Path(entry.path), entry.stat().st_size))
+                    break
+    
+    # 与逐个扩展名glob的顺序一致
+    return [item for ext in SUPPORTED_EXTENSIONS for item in grouped[ext]]
+
+
+def get_worker_count() -> int:
+    """进程池大小，可用环境变量LAW_TEST_WORKERS覆盖，默认保留一个核心给主进程"""
+    env_value = os.environ.get("LAW_TEST_WORKERS")
+    if env_value:
+        return max(1, int(env_value))
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def _prefetch(path: str):
+    """提示内核把文件预读到页缓存，与前面文件的切分重叠IO等待"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _process_one(path: str, max_tokens: int, output_dir: Path):
+    """
+    在工作进程中切分并保存单个法律文档
+    
+    Returns:
+        (文件名, 结果字典)
+    """
+    file_name = Path(path).name
+    start_time = time.time()
+    
+    try:
+        # 使用法律文档专用切分器
+        chunks = split_legal_document(path, max_tokens=max_tokens)
+        
+        # 保存chunks到文件
+        output_file = save_law_chunks_to_file(file_name, chunks, output_dir, path)
+        
+        return file_name, {
+            'success': True,
+            'chunks_count': len(chunks),
+            'output_file': output_file,
+            'processing_time': time.time() - start_time
+        }
+        
+    except Exception as e:
+        return file_name, {
+            'success': False,
+            'error': str(e),
+            'processing_time': time.time() - start_time
+        }
+
+
 def save_law_chunks_to_file(file_name: str, chunks: list, output_dir: Path, original_path: str) -> str:
     """保存法律文档chunks到文件"""
     
@@ -107,51 +188,52 @@ def save_law_chunks_to_file(file_name: str, chunks: list, output_dir: Path, orig
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_file = output_dir / f"{base_name}_法律条文切分_{timestamp}.txt"
     
-    # 写入chunks
-    with open(output_file, 'w', encoding='utf-8') as f:
+    sep40 = "-" * 40 + "\n"
+    sep80 = "=" * 80 + "\n"
+    
+    # 先拼好全部内容，最后一次写入，避免大量零碎的f.write
+    parts = [
         # 文件头信息
-        f.write("🏛️ 法律文档智能切分结果\n")
-        f.write("=" * 80 + "\n")
-        f.write(f"📄 原文件: {file_name}\n")
-        f.write(f"📂 文件路径: {original_path}\n")
-        f.write(f"⏰ 处理时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"📊 总chunks数: {len(chunks)}\n")
-        f.write(f"🔧 切分方式: 层次化法律条文切分\n")
-        f.write("=" * 80 + "\n\n")
-        
-        # 写入每个chunk
-        for i, chunk in enumerate(chunks, 1):
-            f.write(f"📋 Chunk {i:03d}\n")
-            f.write("-" * 40 + "\n")
-            f.write(f"📏 长度: {len(chunk)} 字符\n")
-            f.write("-" * 40 + "\n")
-            f.write(chunk)
-            f.write("\n\n" + "=" * 80 + "\n\n")
-        
-        # 文件尾信息
-        f.write("📊 切分统计信息\n")
-        f.write("-" * 40 + "\n")
-        f.write(f"总chunks数: {len(chunks)}\n")
-        f.write(f"平均长度: {sum(len(chunk) for chunk in chunks) / len(chunks):.1f} 字符\n")
-        f.write(f"最长chunk: {max(len(chunk) for chunk in chunks)} 字符\n")
-        f.write(f"最短chunk: {min(len(chunk) for chunk in chunks)} 字符\n")
-        
-        # 分析chunk结构
-        analyze_chunk_structure_in_file(chunks, f)
+        "🏛️ 法律文档智能切分结果\n",
+        sep80,
+        f"📄 原文件: {file_name}\n",
+        f"📂 文件路径: {original_path}\n",
+        f"⏰ 处理时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+        f"📊 总chunks数: {len(chunks)}\n",
+        f"🔧 切分方式: 层次化法律条文切分\n",
+        sep80 + "\n",
+    ]
+    
+    # 每个chunk的长度只算一次，正文和统计信息共用
+    chunk_lengths = [len(chunk) for chunk in chunks]
+    
+    # 每个chunk
+    chunk_separator = "\n\n" + sep80 + "\n"
+    for i, (chunk, chunk_length) in enumerate(zip(chunks, chunk_lengths), 1):
+        parts.append(f"📋 Chunk {i:03d}\n{sep40}📏 长度: {chunk_length} 字符\n{sep40}")
+        parts.append(chunk)
+        parts.append(chunk_separator)
+    
+    # 文件尾信息
+    parts.append("📊 切分统计信息\n")
+    parts.append(sep40)
+    parts.append(f"总chunks数: {len(chunks)}\n")
+    parts.append(f"平均长度: {sum(chunk_lengths) / len(chunks):.1f} 字符\n")
+    parts.append(f"最长chunk: {max(chunk_lengths)} 字符\n")
+    parts.append(f"最短chunk: {min(chunk_lengths)} 字符\n")
+    
+    # 分析chunk结构
+    parts.append(analyze_chunk_structure_in_file(chunks))
+    
+    with open(output_file, 'w', encoding='utf-8', buffering=1024 * 1024) as f:
+        f.write("".join(parts))
     
     return str(output_file)
 
 
-def analyze_chunk_structure_in_file(chunks: list, file_handle):
-    """在文件中分析chunk结构"""
-    import sys
-    import os
-    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-    from contract_splitter.legal_structure_detector import get_legal_detector, LegalStructureLevel
-
-    file_handle.write("\n📈 结构分析\n")
-    file_handle.write("-" * 40 + "\n")
+def analyze_chunk_structure_in_file(chunks: list) -> str:
+    """分析chunk结构，返回写入结果文件的统计文本"""
+    lines = ["\n📈 结构分析\n", "-" * 40 + "\n"]
 
     # 统计不同类型的chunk
     structure_stats = {
@@ -163,30 +245,32 @@ def analyze_chunk_structure_in_file(chunks: list, file_handle):
     }
 
     # 使用统一的结构检测器
-    detector = get_legal_detector("legal")
+    detector = _LEGAL_DETECTOR
     
     for chunk in chunks:
         chunk_type = '普通内容'
 
         # 使用统一的结构检测器判断类型
-        if detector.is_legal_heading(chunk):
-            level = detector.get_heading_level(chunk)
-            if level in [LegalStructureLevel.CHAPTER.value, LegalStructureLevel.BOOK.value, LegalStructureLevel.PART.value]:
+        is_heading, level = detector.classify(chunk)
+        if is_heading:
+            if level in CHAPTER_LEVELS:
                 chunk_type = '章节'
-            elif level == LegalStructureLevel.ARTICLE.value:
+            elif level == ARTICLE_LEVEL:
                 chunk_type = '条文'
-            elif level in [LegalStructureLevel.CLAUSE.value, LegalStructureLevel.ITEM.value]:
+            elif level in CLAUSE_LEVELS:
                 chunk_type = '款项'
-            elif level >= LegalStructureLevel.ENUMERATION.value:
+            elif level >= ENUMERATION_LEVEL:
                 chunk_type = '序号'
 
         structure_stats[chunk_type] += 1
     
-    # 写入统计结果
+    # 统计结果
     for type_name, count in structure_stats.items():
         if count > 0:
             percentage = (count / len(chunks)) * 100
-            file_handle.write(f"{type_name}: {count} ({percentage:.1f}%)\n")
+            lines.append(f"{type_name}: {count} ({percentage:.1f}%)\n")
+    
+    return "".join(lines)
 
 
 def generate_law_test_report(results: dict, total_chunks: int, output_dir: Path):
@@ -227,11 +227,9 @@ def test_config_save_load():
         config.config["llm"]["provider"] = "test"
         config.config["legal"]["max_tokens"] = 999
         
-        # 保存到临时文件
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            config_file = f.name
-        
-        try:
+        # 保存到临时目录，退出时连同文件一起清理
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = str(Path(tmpdir) / 'cfg.json')
             config.save_to_file(config_file)
             print(f"  配置已保存到: {config_file}")
             
@@ -245,9 +243,6 @@ def test_config_save_load():
             
             print("  ✅ 配置保存和加载测试通过")
             
-        finally:
-            os.unlink(config_file)
-            
     except Exception as e:
         print(f"  ❌ 配置保存和加载测试失败: {e}")
         import traceback
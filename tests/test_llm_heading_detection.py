@@ -3,7 +3,9 @@
 测试LLM标题检测功能
 """
 
+import json
 import os
+import re
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -11,6 +13,10 @@ from contract_splitter import DocxSplitter
 from contract_splitter.llm_heading_detector import LLMHeadingDetector
 
 
+# 模拟LLM客户端识别提示中的编号文本行
+_ENUM_LINE_RE = re.compile(r'\d+\.')
+
+
 def test_llm_heading_detector_standalone():
     """测试独立的LLM标题检测器"""
     print("🧠 测试独立LLM标题检测器")
@@ -99,11 +105,9 @@ def test_mock_llm_client():
         def generate(self, prompt: str) -> str:
             """模拟生成响应"""
             # 简单的模拟逻辑：根据提示中的文本数量返回结果
-            import re
-            
             # 提取文本数量
             lines = prompt.split('\n')
-            text_lines = [line for line in lines if re.match(r'^\d+\.', line.strip())]
+            text_lines = [line for line in lines if _ENUM_LINE_RE.match(line.lstrip())]
             count = len(text_lines)
             
             # 生成模拟响应
@@ -125,7 +129,6 @@ def test_mock_llm_client():
                 else:
                     results.append({"is_heading": False, "level": 0, "confidence": 0.5})
             
-            import json
             return json.dumps(results)
     
     # 创建带模拟LLM的检测器
@@ -3,6 +3,7 @@
 Test script to convert and process the .doc file using MarkItDown for better table structure preservation.
 """
 
+import mmap
 import os
 import sys
 from pathlib import Path
@@ -60,6 +61,69 @@ def test_markitdown_conversion():
         import traceback
         traceback.print_exc()
 
+def iter_markdown_lines(markdown_file):
+    """Yield the lines of a markdown file, same as content.split('\n').
+    
+    content is what a text-mode read returns, so \r\n and a bare \r both
+    count as line breaks. The file is read through a read-only mmap and
+    decoded one line at a time, so the whole document is never held as a
+    single string.
+    """
+    with open(markdown_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap cannot map an empty file
+            yield ''
+            return
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            
+            ends_with_newline = False
+            for raw in iter(mm.readline, b''):
+                line = raw.decode('utf-8')
+                ends_with_newline = line.endswith('\n')
+                if ends_with_newline:
+                    line = line[:-1]
+                    # \r\n is a single line break
+                    if line.endswith('\r'):
+                        line = line[:-1]
+                # Any remaining \r is a bare line break of its own
+                yield from line.split('\r')
+            
+            if ends_with_newline:
+                yield ''
+
+def chunk_markdown_lines(lines, max_chunk_size=1000):
+    """Group lines into chunks of roughly max_chunk_size characters.
+    
+    Lines are collected in a list and joined once per chunk, instead of
+    growing a string with += for every line.
+    """
+    chunks = []
+    current_parts = []
+    current_len = 0
+    has_content = False  # whether the current chunk has non-whitespace text
+    
+    for line in lines:
+        # Check if adding this line would exceed chunk size
+        if current_len + len(line) > max_chunk_size and has_content:
+            chunks.append("".join(current_parts).strip())
+            current_parts = [line, '\n']
+            current_len = len(line) + 1
+            has_content = bool(line.strip())
+        else:
+            current_parts.append(line)
+            current_parts.append('\n')
+            current_len += len(line) + 1
+            has_content = has_content or bool(line.strip())
+    
+    # Add the last chunk
+    if has_content:
+        chunks.append("".join(current_parts).strip())
+    
+    return chunks
+
 def test_markitdown_with_chunking():
     """Test MarkItDown with our chunking system."""
     
@@ -73,28 +137,17 @@ def test_markitdown_with_chunking():
     print(f"\nStep 3: Processing MarkItDown output with chunking...")
     
     try:
-        # Read the markdown content
-        with open(markdown_file, 'r', encoding='utf-8') as f:
-            markdown_content = f.read()
-        
-        # Simple chunking based on markdown structure
-        chunks = []
-        current_chunk = ""
-        max_chunk_size = 1000
-        
-        lines = markdown_content.split('\n')
+        # Stream the markdown lines, counting characters on the way
+        original_length = -1  # lines are joined by one fewer newline than their count
         
-        for line in lines:
-            # Check if adding this line would exceed chunk size
-            if len(current_chunk) + len(line) > max_chunk_size and current_chunk.strip():
-                chunks.append(current_chunk.strip())
-                current_chunk = line + '\n'
-            else:
-                current_chunk += line + '\n'
+        def counted_lines():
+            nonlocal original_length
+            for line in iter_markdown_lines(markdown_file):
+                original_length += len(line) + 1
+                yield line
         
-        # Add the last chunk
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
+        # Simple chunking based on markdown structure
+        chunks = chunk_markdown_lines(counted_lines(), max_chunk_size=1000)
         
         print(f"✓ Created {len(chunks)} chunks from MarkItDown output")
         
@@ -106,7 +159,7 @@ def test_markitdown_with_chunking():
                 'source_file': "output/【立项申请】首创证券新增代销机构广州农商行的立项申请.doc",
                 'processing_method': 'markitdown_conversion',
                 'total_chunks': len(chunks),
-                'original_length': len(markdown_content)
+                'original_length': original_length
             },
             'chunks': chunks
         }
@@ -4,6 +4,7 @@
 """
 
 import os
+import re
 import sys
 import logging
 from pathlib import Path
@@ -17,6 +18,11 @@ from contract_splitter import split_legal_document
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 条文号模式，模块加载时编译一次
+_ARTICLE_NUMBER_RE = re.compile(r'第[一二三四五六七八九十百千万\d]+条')
+# 以条文号开头的块（match只从开头匹配，等价于^）
+_LEADING_ARTICLE_RE = re.compile(r'(第[一二三四五六七八九十百千万\d]+条)')
+
 
 def test_split_legal_document_excel():
     """测试split_legal_document函数处理Excel文件"""
@@ -36,37 +42,30 @@ def test_split_legal_document_excel():
         logger.info(f"生成的块数量: {len(chunks)}")
         
         # 分析块的内容
-        import re
-
         # 检测第一个块是否是法规名称（通常较短且不包含"第X条"）
         first_chunk = chunks[0] if chunks else ""
         is_law_name = (
             len(first_chunk) < 100 and
             "条例" in first_chunk and
-            not re.search(r'第[一二三四五六七八九十百千万\d]+条', first_chunk)
+            not _ARTICLE_NUMBER_RE.search(first_chunk)
         )
 
         # 检测条文块（包含"第X条"）
-        article_chunks = []
-        for chunk in chunks:
-            if re.search(r'^第[一二三四五六七八九十百千万\d]+条', chunk):
-                article_chunks.append(chunk)
+        article_chunks = [chunk for chunk in chunks if _LEADING_ARTICLE_RE.match(chunk)]
 
         for i, chunk in enumerate(chunks[:10]):  # 只显示前10个块
             logger.info(f"\n--- 块 {i+1} ---")
             logger.info(f"长度: {len(chunk)} 字符")
 
             # 检查块类型
+            article_match = _LEADING_ARTICLE_RE.match(chunk)
             if i == 0 and is_law_name:
                 logger.info("✅ 检测到法规名称块")
                 logger.info(f"内容: {chunk}")
-            elif re.search(r'^第[一二三四五六七八九十百千万\d]+条', chunk):
+            elif article_match:
                 logger.info("✅ 检测到条文块")
                 # 提取条文号
-                article_match = re.search(r'^(第[一二三四五六七八九十百千万\d]+条)', chunk)
-                if article_match:
-                    article_num = article_match.group(1)
-                    logger.info(f"条文号: {article_num}")
+                logger.info(f"条文号: {article_match.group(1)}")
                 logger.info(f"内容预览: {chunk[:100]}...")
             else:
                 logger.info("ℹ️  其他格式块")
@@ -45,12 +45,15 @@ def test_basic_detection():
     for text, expected_is_heading, expected_level in test_cases:
         is_heading = detector.is_legal_heading(text)
         level = detector.get_heading_level(text)
+        classified = detector.classify(text)
         
         print(f"文本: '{text}'")
         print(f"  是否为标题: {is_heading} (期望: {expected_is_heading})")
         print(f"  层级: {level} (期望: {expected_level})")
+        print(f"  classify: {classified}")
         
-        if is_heading == expected_is_heading and level == expected_level:
+        if (is_heading == expected_is_heading and level == expected_level and
+                classified == (expected_is_heading, expected_level)):
             print("  ✅ 通过")
             success_count += 1
         else: